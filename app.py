@@ -1,10 +1,123 @@
 import streamlit as st
-import tempfile, shutil, os
-from parser import extract_text, extract_entities, clean_text
-from scoring import score_resume
+import os
+import sqlite3
+import hashlib
+from scoring import score_resume, rank_roles, ResumeFeatures
+from batch import iter_evaluate, parse_resume
+from ranking import TopN
+from timing import summarise_timings
 from feedback import provide_content_recommendations, provide_comprehensive_feedback, provide_formatting_recommendations, provide_alignment_recommendations, provide_optimization_recommendations
 from utils import load_job_profiles
-job_profiles = load_job_profiles()
+from store import CandidateStore
+from skill_index import SkillIndex
+
+
+# Shared by every session and kept across reruns: the compiled profiles. The
+# spaCy model needs no such wrapper; importing batch loads it once per server process
+@st.cache_resource(show_spinner="Loading job profiles...")
+def get_job_profiles():
+    return load_job_profiles()
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    try:
+        return CandidateStore()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Candidate store unavailable: {e}")
+        return None
+
+
+# Saved candidates listed per search, and scored per click of "Score matches"
+SEARCH_RESULTS = 50
+SCORE_MATCHES_BATCH = 200
+
+
+# Built from the store once, then kept up to date as this app saves candidates
+@st.cache_resource(show_spinner="Indexing saved candidates...")
+def get_skill_index(_store):
+    return SkillIndex.from_skill_lists(_store.skill_lists())
+
+
+job_profiles = get_job_profiles()
+
+# Every profile shares the one matcher built by load_job_profiles
+profile_matcher = next(profile.matcher for roles in job_profiles.values() for profile in roles.values())
+
+# Per-session memo, so reruns (slider changes, role switches) don't re-extract or re-score:
+# scores maps (file hash, category, role) to score_data or {"error": message}, and
+# summaries maps file hash to (parsed fields, file extension, ResumeFeatures.summary),
+# for the resumes currently uploaded. A summary is a few KB and holds every
+# profile-independent result, so scoring a resume for another role needs
+# neither its text nor another grammar check
+if "scores" not in st.session_state:
+    st.session_state.scores = {}
+if "summaries" not in st.session_state:
+    st.session_state.summaries = {}
+# (file hash, category, role) already written to the candidate store this session
+if "saved" not in st.session_state:
+    st.session_state.saved = set()
+
+
+def file_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Function to get a resume's profile-independent features, from its summary once it has one
+def resume_features(file_name, data, key):
+    if key in st.session_state.summaries:
+        parsed, file_ext, summary = st.session_state.summaries[key]
+        return ResumeFeatures.from_summary(parsed, summary, profile_matcher, file_ext)
+    cleaned_text, parsed = parse_resume(file_name, data)  # served from the parse cache after the first time
+    return ResumeFeatures(parsed, cleaned_text, os.path.splitext(file_name)[1].lstrip("."))
+
+
+# Function to keep the summary of a resume's features once they are computed
+def remember_summary(key, features):
+    if key not in st.session_state.summaries:
+        st.session_state.summaries[key] = (features.resume_data, features.file_extension, features.summary(profile_matcher))
+
+
+# Function to drop the session's scores and summaries of resumes that are no longer uploaded
+def forget_other_resumes(keys):
+    keys = set(keys)
+    scores = st.session_state.scores
+    for memo_key in [memo_key for memo_key in scores if memo_key[0] not in keys]:
+        del scores[memo_key]
+    summaries = st.session_state.summaries
+    for key in [key for key in summaries if key not in keys]:
+        del summaries[key]
+    st.session_state.saved = {memo_key for memo_key in st.session_state.saved if memo_key[0] in keys}
+
+
+# Function to score a resume against one role in this process, reusing its features
+def score_in_session(file_name, data, key, category, role):
+    memo_key = (key, category, role)
+    if memo_key not in st.session_state.scores:
+        try:
+            features = resume_features(file_name, data, key)
+            st.session_state.scores[memo_key] = score_resume(features.resume_data, job_profiles[category][role], features.text,
+                                                             file_extension=features.file_extension, features=features)
+            remember_summary(key, features)
+        except Exception as e:
+            st.session_state.scores[memo_key] = {"error": f"{type(e).__name__}: {e}"}
+    return st.session_state.scores[memo_key]
+
+
+# Function to keep scored resumes in the candidate store, so later requisitions can search them without re-uploading
+def save_to_store(store, index, files, category, role):
+    """files is a list of (file_name, file_bytes, file_hash) that scored without errors for the role."""
+    known = store.known_hashes(key for _, _, key in files)
+    new = []
+    for name, data, key in files:
+        if key not in known:
+            cleaned_text, parsed = parse_resume(name, data)  # the workers just parsed it, so this is a cache hit
+            new.append((key, name, cleaned_text, parsed))
+    store.add_candidates(new)
+    for candidate_id, skills in store.skill_lists(key for key, _, _, _ in new):
+        index.add(candidate_id, skills)
+    store.add_scores((key, category, role, st.session_state.scores[(key, category, role)]) for _, _, key in files)
+    st.session_state.saved.update((key, category, role) for _, _, key in files)
 
 st.set_page_config(page_title="Intelligent Resume Parser", layout="centered", page_icon="🚀")
 st.title("Intelligent Resume Parser")
@@ -75,33 +188,88 @@ if user_type == "HR / Recruiter":
     with col2:
         min_score = st.slider("Minimum score threshold", 0, 100, 50)
 
-    if st.button("🔍 Evaluate Resumes", type="primary") and uploaded_files:
+    files = [(resume_file.name, resume_file.getvalue()) for resume_file in uploaded_files or []]
+    keys = [file_hash(data) for _, data in files]
+    forget_other_resumes(keys)
+    scores = st.session_state.scores
+    # A batch already scored for this role is shown again on every rerun, so the
+    # sliders re-filter it without another click
+    already_scored = bool(files) and all((key, job_post, job_category) in scores for key in keys)
+
+    if (st.button("🔍 Evaluate Resumes", type="primary") or already_scored) and files:
         progress_bar = st.progress(0)
-        st.info(f"🔄 Processing {len(uploaded_files)} resumes...")
+        job_profile = job_profiles[job_post][job_category]
+        leaderboard = st.empty()
+        live_ranking = TopN(top_n, min_score)
 
-        results = []
-        for i, resume_file in enumerate(uploaded_files):
-            # Update progress
-            progress_bar.progress((i + 1) / len(uploaded_files))
-            
-            # Preserve extension
-            file_ext = os.path.splitext(resume_file.name)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-                shutil.copyfileobj(resume_file, tmp)
-                tmp_path = tmp.name
-
-            raw_text = extract_text(tmp_path)
-            cleaned_text = clean_text(raw_text)
-            parsed = extract_entities(cleaned_text)
-            job_profile = job_profiles[job_post][job_category]
-            score_data = score_resume(parsed, job_profile, cleaned_text, file_extension=file_ext.lstrip("."))
-
-            results.append((resume_file.name, score_data["total_score"], score_data))
-
-        # Filter by minimum score and sort
-        filtered_results = [(name, score, details) for name, score, details in results if score >= min_score]
-        sorted_results = sorted(filtered_results, key=lambda x: x[1], reverse=True)[:top_n]
-        
+        def show_leaderboard(done):
+            rows = [f"| #{rank} | {candidate} | {score}/100 |"
+                    for rank, (candidate, score, _) in enumerate(live_ranking.items(), 1)]
+            leaderboard.markdown(f"**Live leaderboard** ({done}/{len(files)} processed)\n\n"
+                                 "| Rank | Resume | Score |\n|---|---|---|\n" + "\n".join(rows))
+
+        # Resumes summarised this session are re-scored for the role in process,
+        # from their summaries; the others (new uploads, earlier failures) go
+        # through the parallel pipeline
+        summaries = st.session_state.summaries
+        fresh = []
+        for index, ((name, data), key) in enumerate(zip(files, keys)):
+            if key not in summaries:
+                fresh.append(index)
+                continue
+            score_data = score_in_session(name, data, key, job_post, job_category)
+            if "error" not in score_data:
+                live_ranking.push(name, score_data["total_score"], score_data, order=index)
+        if fresh:
+            st.info(f"🔄 Processing {len(fresh)} resumes...")
+            # Stream results into a bounded top-N leaderboard as each resume finishes
+            already_done = len(files) - len(fresh)
+            for done, (index, name, score_data, error) in enumerate(iter_evaluate([files[i] for i in fresh], job_profile, summarise=True), already_done + 1):
+                progress_bar.progress(done / len(files))
+                key = keys[fresh[index]]
+                if error is None:
+                    summaries[key] = (score_data["parsed_data"], os.path.splitext(name)[1].lstrip("."), score_data.pop("features"))
+                scores[(key, job_post, job_category)] = score_data if error is None else {"error": error}
+                if error is None and live_ranking.push(name, score_data["total_score"], score_data, order=fresh[index]):
+                    show_leaderboard(done)
+
+        ranking = TopN(top_n, min_score)
+        errors = []
+        batch_timings = []
+        for index, ((name, _), key) in enumerate(zip(files, keys)):
+            score_data = scores[(key, job_post, job_category)]
+            if "error" in score_data:
+                errors.append((name, score_data["error"]))
+                continue
+            batch_timings.append(score_data.get("timings", {}))
+            ranking.push(name, score_data["total_score"], score_data, order=index)
+
+        store = get_store()
+        unsaved = [(name, data, key) for (name, data), key in zip(files, keys)
+                   if "error" not in scores[(key, job_post, job_category)] and (key, job_post, job_category) not in st.session_state.saved]
+        if store is not None and unsaved:
+            try:
+                save_to_store(store, get_skill_index(store), unsaved, job_post, job_category)
+            except (sqlite3.Error, OSError) as e:
+                st.warning(f"Could not save these candidates: {e}")
+
+        if errors:
+            with st.expander(f"⚠️ {len(errors)} resumes could not be processed"):
+                for name, error in errors:
+                    st.markdown(f"• **{name}**: {error}")
+
+        # Where the batch spent its time, summed over every resume (and worker)
+        stage_totals = summarise_timings(batch_timings)
+        if stage_totals:
+            with st.expander("⏱️ Stage timings for this batch"):
+                rows = [f"| {stage} | {total['resumes']} | {total['wall_ms'] / 1000:.2f} | {total['mean_wall_ms']:.1f} | {total['cpu_ms'] / 1000:.2f} |"
+                        + (f" {total['max_peak_kb']:.0f} |" if "max_peak_kb" in total else " – |")
+                        for stage, total in stage_totals.items()]
+                st.markdown("| Stage | Resumes | Wall time (s) | Mean per resume (ms) | CPU time (s) | Peak memory (KB) |\n"
+                            "|---|---|---|---|---|---|\n" + "\n".join(rows))
+
+        sorted_results = ranking.items()
+        leaderboard.empty()
         progress_bar.empty()
         
         if sorted_results:
@@ -138,6 +306,64 @@ if user_type == "HR / Recruiter":
         else:
             st.warning(f"No candidates found above {min_score}% threshold. Consider lowering the threshold.")
 
+    # Every resume evaluated here is kept, so earlier pools can be searched without re-uploading them
+    store = get_store()
+    if store is not None:
+        with st.expander(f"🗄️ Search saved candidates ({store.count()})"):
+            col1, col2 = st.columns(2)
+            with col1:
+                skill_query = st.text_input("Skills", placeholder="e.g. python AND aws AND NOT azure",
+                                            help="Combine skills with AND, OR, NOT and parentheses")
+                keywords = st.text_input("Words in the resume", placeholder="e.g. payments latency")
+            with col2:
+                min_years = st.number_input("Minimum years of experience", 0.0, 50.0, 0.0, step=0.5)
+                role_only = st.checkbox(f"Only candidates scored for {job_category}", help="Uses the minimum score threshold above")
+
+            index = get_skill_index(store)
+            if len(index) != store.count():  # candidates saved by another process, e.g. the CLI
+                get_skill_index.clear()
+                index = get_skill_index(store)
+            search = dict(min_years=min_years or None, text=keywords)
+            if skill_query.strip():
+                try:
+                    search["ids"], search["exclude_ids"] = index.matches(skill_query)
+                except ValueError as e:
+                    st.error(f"Invalid skill query: {e}")
+                    search["ids"] = []
+            saved_matches = dict(search)
+            if role_only:
+                search.update(category=job_post, role=job_category, min_score=min_score)
+
+            if st.button(f"Score matches for {job_category}", help="Scores saved candidates not yet scored for this role, from their stored text"):
+                pending = store.search(**saved_matches, unscored_for=(job_post, job_category), limit=None)
+                candidates = [store.get(row["file_hash"]) for row in pending[:SCORE_MATCHES_BATCH]]
+                files = [(candidate["file_name"], (candidate["text"], candidate["entities"])) for candidate in candidates]
+                progress_bar = st.progress(0)
+                scored = []
+                for done, (index, name, score_data, error) in enumerate(iter_evaluate(files, job_profiles[job_post][job_category], parsed=True), 1):
+                    progress_bar.progress(done / len(files))
+                    if error is None:
+                        scored.append((candidates[index]["file_hash"], job_post, job_category, score_data))
+                    else:
+                        st.markdown(f"• **{name}**: {error}")
+                progress_bar.empty()
+                store.add_scores(scored)
+                st.success(f"Scored {len(scored)} saved candidates for {job_category}")
+                if len(pending) > len(candidates):
+                    st.info(f"{len(pending) - len(candidates)} more matching candidates are not scored yet; click again to continue")
+
+            try:
+                rows = store.search(**search, limit=SEARCH_RESULTS)
+            except sqlite3.Error as e:
+                st.error(f"Search failed: {e}")
+                rows = []
+            if rows:
+                if len(rows) == SEARCH_RESULTS:
+                    st.caption(f"Showing the first {SEARCH_RESULTS} matches; narrow the search to see others")
+                st.dataframe([{key: value for key, value in row.items() if key not in ("id", "file_hash")} for row in rows])
+            else:
+                st.info("No saved candidates match.")
+
 # Step 2: Job Seeker Flow
 elif user_type == "Job Seeker":
     st.header("Personal Resume Optimizer")
@@ -191,16 +417,11 @@ elif user_type == "Job Seeker":
 
     if st.button("Analyze My Resume", type="primary") and uploaded_file:
         with st.spinner("AI is analyzing your resume..."):
-            file_ext = os.path.splitext(uploaded_file.name)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-                shutil.copyfileobj(uploaded_file, tmp)
-                tmp_path = tmp.name
-
-            raw_text = extract_text(tmp_path)
-            cleaned_text = clean_text(raw_text)
-            parsed = extract_entities(cleaned_text)
-            job_profile = job_profiles[job_post][job_category]
-            score_data = score_resume(parsed, job_profile, cleaned_text, file_extension=file_ext.lstrip("."))
+            data = uploaded_file.getvalue()
+            score_data = score_in_session(uploaded_file.name, data, file_hash(data), job_post, job_category)
+        if "error" in score_data:
+            st.error(f"Could not analyze this resume: {score_data['error']}")
+            st.stop()
             
         # Score display with visual indicator
         score = score_data['total_score']
@@ -253,6 +474,32 @@ elif user_type == "Job Seeker":
             st.markdown("- Use consistent formatting")
             st.markdown("- Tailor for each application")
 
+    # Best-fit roles: score the resume against every role at once
+    if st.button("🧭 Find My Best-Fit Roles") and uploaded_file:
+        with st.spinner("Comparing your resume against every role..."):
+            data = uploaded_file.getvalue()
+            key = file_hash(data)
+            features = resume_features(uploaded_file.name, data, key)
+            ranked_roles = rank_roles(features.resume_data, features.text, job_profiles,
+                                      file_extension=features.file_extension, features=features)
+            remember_summary(key, features)
+
+        st.markdown("### Best-Fit Roles")
+        for rank, entry in enumerate(ranked_roles[:10], 1):
+            score = entry["total_score"]
+            score_color = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
+            with st.expander(f"#{rank} {entry['role']} ({entry['category']}) — {score_color} {score}/100", expanded=(rank == 1)):
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Content", f"{entry['content_score']}/40")
+                with col2:
+                    st.metric("Formatting", f"{entry['formatting_score']}/20")
+                with col3:
+                    st.metric("Optimization", f"{entry['optimization_score']}/18")
+                with col4:
+                    st.metric("Alignment", f"{entry['alignment_score']}/22")
+                st.json(entry["breakdown"], expanded=False)
+
 # Footer
 st.markdown("---")
 st.markdown("### Future-Ready Career Guidance")
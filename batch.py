@@ -0,0 +1,218 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from parser import extract_text, extract_entities, extract_entities_batch, clean_text, parser_settings_fingerprint, NER_BATCH_SIZE
+from scoring import score_resume, ResumeFeatures
+from cache import resume_cache, content_key
+from utils import compile_job_profile
+from timing import StageTimer
+from extraction import ExtractionError
+
+
+# Function to extract and clean the text of an uploaded resume, straight from its bytes
+def read_resume_text(file_name, data, timer=None):
+    """Raises ExtractionError when the file can't be read or holds no text, e.g. a scanned PDF."""
+    if timer is None:
+        timer = StageTimer()
+    with timer.stage("extract_text"):
+        raw_text = extract_text(data, name=file_name)
+    with timer.stage("clean_text"):
+        text = clean_text(raw_text)
+    if not text.strip():
+        raise ExtractionError(f"No text could be extracted from {file_name}; it may be a scanned image")
+    return text
+
+
+# Function to parse many resumes, reusing cached parses and batching NER over the rest
+def parse_resumes(files, cache=resume_cache, batch_size=NER_BATCH_SIZE, timers=None):
+    """
+    files is a list of (file_name, file_bytes) pairs; file_bytes may also be a
+    path, read here. Returns, per file and in the same order, either
+    (cleaned_text, parsed) or the exception it raised. timers, if given, holds
+    one StageTimer per file to record the parsing stages in.
+    """
+    if timers is None:
+        timers = [StageTimer() for _ in files]
+    results = [None] * len(files)
+    pending = []  # (position, cache key, cleaned text) for files not in the cache
+    settings = parser_settings_fingerprint()
+    for position, (file_name, data) in enumerate(files):
+        try:
+            if isinstance(data, (str, os.PathLike)):
+                with open(data, "rb") as f:
+                    data = f.read()
+        except OSError as e:
+            results[position] = e
+            continue
+        key = content_key(data, settings)
+        with timers[position].stage("parse_cache"):
+            cached = cache.get(key)
+        if cached is not None:
+            results[position] = (cached["text"], cached["entities"])
+            continue
+        try:
+            pending.append((position, key, read_resume_text(file_name, data, timers[position])))
+        except Exception as e:
+            results[position] = e
+
+    if not pending:
+        return results
+    texts = [text for _, _, text in pending]
+    try:
+        batch_timer = StageTimer(trace_memory=False)
+        with batch_timer.stage("extract_entities"):
+            entities = extract_entities_batch(texts, batch_size=batch_size)
+        # spaCy works on the batch as a whole, so each resume is charged an equal share
+        share = batch_timer.stages["extract_entities"]
+        for position, _, _ in pending:
+            timers[position].add("extract_entities", share["wall_ms"] / len(pending), share["cpu_ms"] / len(pending))
+    except Exception:
+        # Redo the batch one text at a time so a single bad resume only fails itself
+        entities = []
+        for position, _, text in pending:
+            try:
+                with timers[position].stage("extract_entities"):
+                    entities.append(extract_entities(text))
+            except Exception as e:
+                entities.append(e)
+
+    for (position, key, text), parsed in zip(pending, entities):
+        if isinstance(parsed, Exception):
+            results[position] = parsed
+            continue
+        cache.set(key, {"text": text, "entities": parsed})  # only successful extractions reach here
+        results[position] = (text, parsed)
+    return results
+
+
+# Function to extract and parse a resume, reusing earlier parses of the same bytes
+def parse_resume(file_name, data, cache=resume_cache, timer=None):
+    result = parse_resumes([(file_name, data)], cache, timers=[timer if timer is not None else StageTimer()])[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+# Function to run the whole pipeline on a single resume
+def evaluate_resume(file_name, data, job_profile):
+    timer = StageTimer()
+    cleaned_text, parsed = parse_resume(file_name, data, timer=timer)
+    file_ext = os.path.splitext(file_name)[1]
+    return score_resume(parsed, job_profile, cleaned_text, file_extension=file_ext.lstrip("."), timer=timer)
+
+
+def _init_worker():
+    # Importing parser loads the spaCy model, so each worker pays for it once
+    # at startup instead of on its first resume
+    import parser  # noqa: F401
+    import extraction
+
+    # Resumes are already spread across processes; don't split their pages further
+    extraction.PDF_PARALLEL_PAGES = 0
+
+
+def _error_message(e):
+    return f"{type(e).__name__}: {e}"
+
+
+def _evaluate_chunk(chunk, job_profile, parsed=False, summarise=False):
+    # chunk is a list of (index, file_name, data); NER runs over the whole chunk at once
+    job_profile = compile_job_profile(job_profile)
+    timers = [StageTimer() for _ in chunk]
+    if parsed:
+        parsed_files = [data for _, _, data in chunk]
+    else:
+        parsed_files = parse_resumes([(file_name, data) for _, file_name, data in chunk], timers=timers)
+    results = []
+    for (index, file_name, _), parsed_file, timer in zip(chunk, parsed_files, timers):
+        if isinstance(parsed_file, Exception):
+            results.append((index, None, _error_message(parsed_file)))
+            continue
+        cleaned_text, parsed = parsed_file
+        file_ext = os.path.splitext(file_name)[1]
+        try:
+            features = ResumeFeatures(parsed, cleaned_text, file_ext.lstrip("."), timer)
+            score_data = score_resume(parsed, job_profile, cleaned_text, file_extension=file_ext.lstrip("."),
+                                      features=features, timer=timer)
+            if summarise:
+                score_data["features"] = features.summary(job_profile.matcher)
+            results.append((index, score_data, None))
+        except Exception as e:
+            results.append((index, None, _error_message(e)))
+    return results
+
+
+# Function to evaluate many resumes, yielding each one as soon as it finishes
+def iter_evaluate(files, job_profile, max_workers=None, chunk_size=None, parsed=False, summarise=False):
+    """
+    files is a list of (file_name, file_bytes) pairs, where file_bytes may be
+    a path for the worker to read; with parsed=True it is instead the
+    (cleaned_text, parsed) pair of a resume parsed earlier, e.g. kept in the
+    candidate store, and only the scoring is done. Yields
+    (index, file_name, score_data, error) in completion order; exactly one of
+    score_data and error is None. Workers receive chunk_size resumes at a time
+    so spaCy can batch them; by default chunks are sized to keep every worker
+    busy with a few chunks each, up to NER_BATCH_SIZE resumes. With
+    summarise=True each score_data also holds the resume's
+    ResumeFeatures.summary under "features", so it can later be scored
+    against the other profiles loaded with job_profile, without the text.
+    """
+    files = list(files)
+    if not files:
+        return
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(files)))
+    if chunk_size is None:
+        chunk_size = max(1, min(NER_BATCH_SIZE, len(files) // (max_workers * 4)))
+    chunks = [
+        [(index, file_name, data) for index, (file_name, data) in enumerate(files[start:start + chunk_size], start)]
+        for start in range(0, len(files), chunk_size)
+    ]
+
+    if max_workers == 1:
+        for chunk in chunks:
+            for index, score_data, error in _evaluate_chunk(chunk, job_profile, parsed, summarise):
+                yield index, files[index][0], score_data, error
+        return
+
+    # spawn rather than fork: the Streamlit server is multi-threaded and forking
+    # it can deadlock on locks held by other threads
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker)
+    finished = False
+    try:
+        futures = {pool.submit(_evaluate_chunk, chunk, job_profile, parsed, summarise): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                chunk_results = future.result()
+            except Exception as e:  # worker crashed, e.g. BrokenProcessPool
+                chunk_results = [(index, None, _error_message(e)) for index, _, _ in futures[future]]
+            for index, score_data, error in chunk_results:
+                yield index, files[index][0], score_data, error
+        finished = True
+    finally:
+        # A caller that stops early (e.g. a Streamlit rerun closing this
+        # generator) must not wait for the rest of the batch: drop the queued
+        # chunks and let the running ones finish in the background
+        pool.shutdown(wait=finished, cancel_futures=not finished)
+
+
+# Function to evaluate many resumes and collect the results in upload order
+def evaluate_batch(files, job_profile, max_workers=None, chunk_size=None, on_progress=None):
+    """
+    Returns (results, errors): results is a list of (file_name, score_data)
+    and errors a list of (file_name, message), both in the order of files.
+    on_progress(done, total) is called after every completed resume.
+    """
+    files = list(files)
+    slots = [None] * len(files)
+    for done, (index, file_name, score_data, error) in enumerate(iter_evaluate(files, job_profile, max_workers, chunk_size), 1):
+        slots[index] = (file_name, score_data, error)
+        if on_progress:
+            on_progress(done, len(files))
+
+    results = [(name, score_data) for name, score_data, error in slots if error is None]
+    errors = [(name, error) for name, score_data, error in slots if error is not None]
+    return results, errors
@@ -0,0 +1,2 @@
+"""Micro-benchmarks for the parsing and scoring pipeline. Run them from the
+repository root, e.g. ``python -m benchmarks.bench_skills``."""
@@ -0,0 +1,81 @@
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+MODES = ("full", "ner", "fast")
+PARITY_DOCS = 50
+
+
+# Runs in a fresh interpreter per mode (selected through RESUME_PARSER_NLP_MODE)
+# so load time and RSS are not polluted by the other mode
+def measure(n_docs=50):
+    # Import the libraries first so only the model load is attributed to parser
+    import spacy
+    import pdfplumber  # noqa: F401
+    import docx  # noqa: F401
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    import parser
+    load_seconds = time.perf_counter() - start
+    nlp = parser.nlp
+
+    from benchmarks.bench_skills import synthetic_resume
+    known_skills = parser.known_skills
+    texts = [synthetic_resume(known_skills, n_lines=80, seed=seed) for seed in range(n_docs)]
+    nlp(texts[0])  # warm-up
+    start = time.perf_counter()
+    entities = []
+    for text in texts:
+        entities.append([(ent.start_char, ent.end_char, ent.label_) for ent in nlp(text).ents])
+    per_doc_ms = (time.perf_counter() - start) / n_docs * 1000
+
+    return {
+        "mode": parser.NLP_MODE,
+        "spacy": spacy.__version__,
+        "pipeline": nlp.pipe_names,
+        "load_seconds": round(load_seconds, 3),
+        "per_resume_ms": round(per_doc_ms, 2),
+        # ru_maxrss is in KiB on Linux
+        "rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "model_rss_mb": round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024, 1),
+        "entities": entities[:PARITY_DOCS],
+    }
+
+
+def main():
+    results = []
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_nlp", "--child"],
+            env=dict(os.environ, RESUME_PARSER_NLP_MODE=mode),
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    for result in results:
+        print(f"{result['mode']:>5}: load {result['load_seconds']:6.3f} s  "
+              f"per resume {result['per_resume_ms']:7.2f} ms  "
+              f"RSS {result['rss_mb']:7.1f} MB (model {result['model_rss_mb']:.1f} MB)  "
+              f"pipeline {result['pipeline']}")
+    full = results[0]
+    for result in results[1:]:
+        # Entity parity with the full pipeline, over every entity and over the PERSON ones name detection uses
+        pairs = list(zip(full["entities"], result["entities"]))
+        same = sum(ours == theirs for ours, theirs in pairs)
+        same_people = sum([ent for ent in ours if ent[2] == "PERSON"] == [ent for ent in theirs if ent[2] == "PERSON"]
+                          for ours, theirs in pairs)
+        print(f"{result['mode']} vs full: load {full['load_seconds'] / result['load_seconds']:.1f}x faster, "
+              f"per resume {full['per_resume_ms'] / result['per_resume_ms']:.1f}x faster, "
+              f"RSS {full['rss_mb'] - result['rss_mb']:.1f} MB smaller, "
+              f"entities identical on {same}/{len(pairs)} resumes (PERSON {same_people}/{len(pairs)})")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--child"]:
+        print(json.dumps(measure()))
+    else:
+        main()
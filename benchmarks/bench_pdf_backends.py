@@ -0,0 +1,60 @@
+import difflib
+import os
+import sys
+import tempfile
+import time
+
+from parser import PDF_BACKENDS, known_skills
+from benchmarks.bench_skills import synthetic_resume
+from benchmarks.pdf_writer import write_pdf
+
+LINES_PER_PAGE = 55
+
+
+def synthetic_corpus(directory, n_resumes=20):
+    """Writes n_resumes one- to three-page PDFs; returns (path, expected text) pairs."""
+    corpus = []
+    for seed in range(n_resumes):
+        lines = synthetic_resume(known_skills, LINES_PER_PAGE * (1 + seed % 3), seed).split("\n")
+        path = os.path.join(directory, f"resume_{seed}.pdf")
+        with open(path, "wb") as f:
+            f.write(write_pdf([lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]))
+        corpus.append((path, "\n".join(lines)))
+    return corpus
+
+
+def fidelity(text, expected):
+    # Similarity of the whitespace-normalised lines, 1.0 being identical
+    normalise = lambda t: [" ".join(line.split()) for line in t.splitlines() if line.strip()]
+    return difflib.SequenceMatcher(None, normalise(text), normalise(expected), autojunk=False).ratio()
+
+
+def run(corpus):
+    results = {}
+    for name, iter_pages in PDF_BACKENDS.items():
+        start = time.perf_counter()
+        texts = ["\n".join(iter_pages(path, max_pages=0, max_chars=0)) for path, _ in corpus]
+        seconds = time.perf_counter() - start
+        results[name] = (seconds, texts)
+    return results
+
+
+def main(paths=()):
+    """With no arguments, benchmarks a synthetic corpus against its known text.
+    Given PDF paths, fidelity is measured against pdfplumber's output instead."""
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = [(path, None) for path in paths] or synthetic_corpus(directory)
+        results = run(corpus)
+
+    reference = results["pdfplumber"][1]
+    print(f"{len(corpus)} resumes")
+    print("backend      ms/resume  speed-up  fidelity")
+    for name, (seconds, texts) in results.items():
+        expected = [text for _, text in corpus] if corpus[0][1] is not None else reference
+        score = sum(fidelity(text, want) for text, want in zip(texts, expected)) / len(texts)
+        speedup = results["pdfplumber"][0] / seconds
+        print(f"{name:<12} {seconds / len(corpus) * 1000:9.1f} {speedup:8.2f}x {score:9.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,76 @@
+import os
+import math
+import tempfile
+import time
+
+import extraction
+from benchmarks.bench_skills import synthetic_resume
+from benchmarks.pdf_writer import write_pdf
+
+PAGE_COUNTS = (1, 2, 3, 4, 6, 8, 12, 16)
+
+
+def synthetic_pdf(n_pages, lines_per_page=55):
+    from parser import known_skills
+
+    lines = synthetic_resume(known_skills, n_pages * lines_per_page).split("\n")
+    return write_pdf([lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)])
+
+
+def time_extraction(path, parallel, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        "".join(extraction.iter_pdf_pages(path, max_pages=0, max_chars=0, parallel=parallel))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_call(function, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Function to estimate the crossover from the cost of a page and of a worker round trip
+def predicted_crossover(path, pages, worker_counts=(2, 4, 8)):
+    """
+    Parallel speed-up can only be measured with as many cores as workers; the
+    two costs it trades off can be measured on any machine. Reading p pages
+    serially costs p * page; split over w workers it costs about one round
+    trip plus ceil(p / w) * page.
+    """
+    pool = extraction.page_pool()
+    page = (time_call(extraction.extract_page_range, path, 1, pages, repeat=2) - time_call(extraction.extract_page_range, path, 1, 0)) / pages
+    round_trip = max(0.0, time_call(lambda: pool.submit(extraction.extract_page_range, path, 1, 1).result()) - time_call(extraction.extract_page_range, path, 1, 1))
+    print(f"page: {page * 1000:.1f} ms, worker round trip: {round_trip * 1000:.1f} ms")
+    for workers in worker_counts:
+        crossover = next(p for p in range(1, 1000) if p * page > round_trip + math.ceil(p / workers) * page)
+        print(f"{workers} workers: parallel pays off from {crossover} pages")
+
+
+def main():
+    start = time.perf_counter()
+    pool = extraction.page_pool()
+    list(pool.map(abs, range(extraction.PDF_PAGE_WORKERS * 2)))  # start every worker
+    print(f"pool start-up: {time.perf_counter() - start:.2f} s for {extraction.PDF_PAGE_WORKERS} workers (paid once per process)")
+
+    print(f"{os.cpu_count()} CPUs")
+    print("pages   serial ms  parallel ms  speed-up")
+    with tempfile.TemporaryDirectory() as directory:
+        for n_pages in PAGE_COUNTS:
+            path = os.path.join(directory, f"{n_pages}.pdf")
+            with open(path, "wb") as f:
+                f.write(synthetic_pdf(n_pages))
+            time_extraction(path, True, repeat=1)  # let each worker import pdfplumber's lazy modules
+            serial = time_extraction(path, False)
+            parallel = time_extraction(path, True)
+            print(f"{n_pages:5d} {serial * 1000:11.1f} {parallel * 1000:12.1f} {serial / parallel:9.2f}x")
+        predicted_crossover(path, PAGE_COUNTS[-1])
+
+
+if __name__ == "__main__":
+    main()
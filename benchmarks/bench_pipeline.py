@@ -0,0 +1,126 @@
+"""
+Per-stage timings of the whole pipeline over a synthetic corpus.
+
+    python -m benchmarks.bench_pipeline -o before.json
+    python -m benchmarks.bench_pipeline -o after.json --compare before.json
+
+Results are JSON so runs on different commits can be compared.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+
+from benchmarks.corpus import generate
+
+STAGES = ("extract_text", "clean_text", "extract_sections", "extract_entities", "score_content",
+          "score_formatting", "score_optimization", "score_alignment", "score_resume", "end_to_end")
+END_TO_END = ("extract_text", "clean_text", "extract_entities", "score_resume")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _timed(samples, stage, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    samples[stage].append(time.perf_counter() - start)
+    return result
+
+
+# Function to time every pipeline stage on each resume of the corpus
+def run(corpus, job_profile, grammar=False):
+    import scoring
+    from parser import extract_text, clean_text, extract_sections, extract_entities
+
+    if not grammar:
+        # Keep the network out of the measurement unless asked for
+        scoring.grammar_check = lambda text, backend=None: 0
+
+    samples = {stage: [] for stage in STAGES}
+    for file_name, data, _ in corpus:
+        extension = file_name.rsplit(".", 1)[-1]
+        raw = _timed(samples, "extract_text", extract_text, data)
+        text = _timed(samples, "clean_text", clean_text, raw)
+        _timed(samples, "extract_sections", extract_sections, text)
+        parsed = _timed(samples, "extract_entities", extract_entities, text)
+        # Each scorer on its own, computing everything it needs from scratch
+        _timed(samples, "score_content", scoring.score_content, parsed, job_profile)
+        _timed(samples, "score_formatting", scoring.score_formatting, text, parsed, extension)
+        _timed(samples, "score_optimization", scoring.score_optimization, text, job_profile)
+        _timed(samples, "score_alignment", scoring.score_alignment, text, parsed, job_profile)
+        _timed(samples, "score_resume", scoring.score_resume, parsed, job_profile, text, extension)
+        # What the app runs per resume; extract_sections is part of extract_entities
+        samples["end_to_end"].append(sum(samples[stage][-1] for stage in END_TO_END))
+    return samples
+
+
+def summarise(samples):
+    summary = {}
+    for stage, seconds in samples.items():
+        ordered = sorted(seconds)
+        summary[stage] = {
+            "n": len(seconds),
+            "mean_ms": round(statistics.fmean(seconds) * 1000, 3),
+            "median_ms": round(statistics.median(seconds) * 1000, 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+            "total_s": round(sum(seconds), 4),
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each pipeline stage over a synthetic corpus.")
+    parser.add_argument("--count", type=int, default=30, help="resumes in the corpus")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--category", default="Experienced")
+    parser.add_argument("--role", default="Senior Software Developer")
+    parser.add_argument("--grammar", action="store_true", help="include the configured grammar backend")
+    parser.add_argument("-o", "--output", default="pipeline_bench.json")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    from utils import load_job_profiles
+
+    job_profile = load_job_profiles()[args.category][args.role]
+    corpus = generate(args.count, args.seed)
+    run(corpus[:2], job_profile, args.grammar)  # warm-up: lazy imports, compiled regexes
+    samples = run(corpus, job_profile, args.grammar)
+
+    results = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "corpus": {"count": args.count, "seed": args.seed},
+            "role": [args.category, args.role],
+            "grammar": args.grammar,
+        },
+        "stages": summarise(samples),
+    }
+    results["throughput_resumes_per_s"] = round(args.count / results["stages"]["end_to_end"]["total_s"], 2)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["stages"]
+    print(f"{'stage':<20}{'mean ms':>10}{'p95 ms':>10}" + (f"{'vs base':>10}" if baseline else ""))
+    for stage, stats in results["stages"].items():
+        line = f"{stage:<20}{stats['mean_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+        if baseline and stage in baseline and stats["mean_ms"]:
+            line += f"{baseline[stage]['mean_ms'] / stats['mean_ms']:>9.2f}x"
+        print(line)
+    print(f"throughput: {results['throughput_resumes_per_s']} resumes/s; results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import random
+import timeit
+
+import scoring
+from parser import extract_entities, known_skills
+from utils import load_job_profiles
+from benchmarks.bench_skills import synthetic_resume
+
+
+def synthetic_scored_resume(n_lines, seed=0):
+    rng = random.Random(seed)
+    header = ["JANE DOE", "jane.doe@example.com | (555) 123-4567 | linkedin.com/in/janedoe", "Skills",
+              ", ".join(rng.sample(known_skills, 12)), "Work Experience"]
+    body = synthetic_resume(known_skills, n_lines, seed).split("\n")
+    for i in range(0, len(body), 12):
+        year = 2012 + i // 12
+        body.insert(i, f"Software Engineer, Acme Corp  Jan {year} - Mar {year + 1}")
+    return "\n".join(header + ["- " + line for line in body] + ["Education", "B.Tech, 2011", "Certifications", "AWS Certified Developer"])
+
+
+def main(number=50):
+    # Keep the network out of the measurement; only the text scans are timed
+    scoring.grammar_check = lambda text, backend=None: 0
+    job_profile = load_job_profiles()["Experienced"]["Senior Software Developer"]
+    for n_lines in (40, 120, 400):
+        text = synthetic_scored_resume(n_lines)
+        parsed = extract_entities(text)
+        seconds = timeit.timeit(lambda: scoring.score_resume(parsed, job_profile, text), number=number) / number
+        print(f"{n_lines:4d} lines ({len(text):6d} chars): score_resume {seconds * 1000:7.3f} ms per resume")
+
+
+if __name__ == "__main__":
+    main()
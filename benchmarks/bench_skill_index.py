@@ -0,0 +1,75 @@
+"""
+Boolean skill queries over an inverted bitmap index versus rescanning every
+candidate's skills list.
+
+    python -m benchmarks.bench_skill_index --count 50000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from skill_index import SkillIndex, canonical_skill, parse_query
+
+QUERIES = [
+    "python AND aws",
+    "python AND aws AND NOT azure",
+    "(sql OR nlp) AND NOT (react OR aws)",
+    "NOT kotlin",
+]
+
+
+def scan(candidates, node):
+    # What filtering looks like without an index: test every candidate's skill set
+    def matches(skills, node):
+        kind = node[0]
+        if kind == "skill":
+            return node[1] in skills
+        if kind == "not":
+            return not matches(skills, node[1])
+        if kind == "and":
+            return matches(skills, node[1]) and matches(skills, node[2])
+        return matches(skills, node[1]) or matches(skills, node[2])
+    return [candidate_id for candidate_id, skills in candidates if matches(skills, node)]
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time boolean skill queries with and without the inverted index.")
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    from parser import known_skills
+
+    rng = random.Random(0)
+    candidates = [(index, {canonical_skill(skill) for skill in rng.sample(known_skills, rng.randint(3, 12))})
+                  for index in range(args.count)]
+
+    start = time.perf_counter()
+    index = SkillIndex.from_skill_lists(candidates)
+    print(f"built index of {len(index)} candidates in {(time.perf_counter() - start) * 1000:.0f} ms")
+    start = time.perf_counter()
+    for candidate_id in range(args.count, args.count + 1000):
+        index.add(candidate_id, rng.sample(known_skills, 5))
+    print(f"added 1000 more one at a time in {(time.perf_counter() - start) * 1000:.0f} ms")
+    candidates += [(candidate_id, index._skills[index._slots[candidate_id]]) for candidate_id in range(args.count, args.count + 1000)]
+
+    print(f"{'query':<40}{'matches':>9}{'scan ms':>10}{'index ms':>10}{'count ms':>10}")
+    for query in QUERIES:
+        node = parse_query(query)
+        assert index.search(node) == scan(candidates, node)
+        print(f"{query:<40}{index.count(node):>9}{median_ms(lambda: scan(candidates, node), args.repeat):>10.2f}"
+              f"{median_ms(lambda: index.search(node), args.repeat):>10.2f}{median_ms(lambda: index.count(node), args.repeat):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
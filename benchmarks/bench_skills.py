@@ -0,0 +1,62 @@
+import json
+import random
+import timeit
+
+from parser import extract_skills, known_skills
+
+
+# The implementation extract_skills replaced, kept here as the baseline
+def legacy_extract_skills(text, known_skills):
+    skills = []
+    for skill in known_skills:
+        if skill.lower() in text.lower():
+            skills.append(skill)
+    return skills
+
+
+def synthetic_resume(terms, n_lines=120, seed=0):
+    rng = random.Random(seed)
+    filler = ["developed", "a", "scalable", "service", "for", "the", "team", "using",
+              "and", "improved", "latency", "by", "30%", "with", "clients", "across", "regions"]
+    lines = []
+    for _ in range(n_lines):
+        words = rng.sample(filler, 8)
+        if rng.random() < 0.4:
+            words.insert(rng.randrange(len(words)), rng.choice(terms))
+        lines.append(" ".join(words))
+    return "\n".join(lines)
+
+
+def profile_vocabulary(filepath="job_profile.json"):
+    with open(filepath, "r") as f:
+        profiles = json.load(f)
+    fields = ("required_skills", "preferred_skills", "keywords", "job_specific_keywords")
+    return sorted({term for roles in profiles.values() for profile in roles.values()
+                   for field in fields for term in profile.get(field, [])})
+
+
+def run(terms, n_lines):
+    text = synthetic_resume(terms, n_lines)
+    legacy = set(legacy_extract_skills(text, terms))
+    current = set(extract_skills(text, terms))
+    number = 50
+    t_legacy = timeit.timeit(lambda: legacy_extract_skills(text, terms), number=number) / number
+    t_current = timeit.timeit(lambda: extract_skills(text, terms), number=number) / number
+    print(f"  {n_lines:4d} lines ({len(text):6d} chars): "
+          f"legacy {t_legacy * 1000:7.3f} ms  matcher {t_current * 1000:7.3f} ms  "
+          f"speedup {t_legacy / t_current:5.1f}x")
+    if legacy != current:
+        # Differences come from word boundaries, e.g. "SQL" no longer matches inside "MySQL"
+        print(f"    only legacy: {sorted(legacy - current)}  only matcher: {sorted(current - legacy)}")
+
+
+def main():
+    vocabularies = [("known_skills", known_skills), ("job_profile.json terms", profile_vocabulary())]
+    for label, terms in vocabularies:
+        print(f"{label}: {len(terms)} terms")
+        for n_lines in (40, 120, 400):
+            run(terms, n_lines)
+
+
+if __name__ == "__main__":
+    main()
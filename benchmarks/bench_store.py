@@ -0,0 +1,77 @@
+"""
+Bulk insert and query times of the SQLite candidate store.
+
+    python -m benchmarks.bench_store --count 50000
+
+Candidates are synthetic one-page resumes, so no PDF parsing or NER is timed.
+Their vocabulary is small: a text query for common words matches almost the
+whole pool and shows the worst case, a name query the usual one.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.corpus import resume_lines
+from store import CandidateStore
+
+QUERIES = [
+    {"skills": ["kubernetes"], "min_years": 3},
+    {"skills": ["python", "aws"]},
+    {"skills": ["python", "aws", "docker"], "min_years": 5},
+    {"text": "priya iyer"},
+    {"text": "payments api latency"},  # the synthetic corpus has these words in nearly every resume
+    {"skills": ["sql"], "text": "dashboard", "min_years": 1},
+    {"category": "Experienced", "role": "Senior Software Developer", "min_score": 60},
+]
+
+
+def synthetic_candidates(count, skills, seed=0):
+    rng = random.Random(seed)
+    for index in range(count):
+        lines = resume_lines(rng, skills, years=rng.choice((1, 2, 4, 6, 10)))
+        entities = {"name": [lines[0].title()], "email": [lines[1].split(" | ")[0]],
+                    "skills": rng.sample(skills, rng.randint(3, 12))}
+        yield f"{index:064x}", f"resume_{index}.pdf", "\n".join(lines), entities
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time bulk inserts and queries of the candidate store.")
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=1000, help="candidates per transaction")
+    parser.add_argument("--repeat", type=int, default=20, help="runs of each query")
+    args = parser.parse_args(argv)
+
+    from parser import known_skills
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CandidateStore(os.path.join(directory, "candidates.db"))
+        rng = random.Random(1)
+        start = time.perf_counter()
+        batch = []
+        for candidate in synthetic_candidates(args.count, known_skills):
+            batch.append(candidate)
+            if len(batch) == args.batch:
+                store.add_candidates(batch)
+                store.add_scores((file_hash, "Experienced", "Senior Software Developer", {"total_score": rng.randint(20, 95)})
+                                 for file_hash, _, _, _ in batch)
+                batch = []
+        store.add_candidates(batch)
+        seconds = time.perf_counter() - start
+        print(f"inserted {store.count()} candidates in {seconds:.1f} s ({store.count() / seconds:.0f}/s), "
+              f"database {os.path.getsize(store.path) / 2 ** 20:.0f} MB")
+
+        for query in QUERIES:
+            times, found = [], 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                found = len(store.search(**query, limit=100))
+                times.append(time.perf_counter() - start)
+            print(f"{statistics.median(times) * 1000:8.2f} ms  {found:>3} shown  {query}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
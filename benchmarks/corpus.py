@@ -0,0 +1,142 @@
+"""
+Synthetic resume corpus for benchmarks: realistic sections, controlled size.
+
+    python -m benchmarks.corpus out_dir --count 50
+
+writes PDF and DOCX resumes plus a manifest.json describing each one.
+"""
+import argparse
+import io
+import json
+import os
+import random
+
+from benchmarks.pdf_writer import write_pdf
+
+LINES_PER_PAGE = 55
+FIRST_NAMES = ["Jane", "Arjun", "Maria", "Wei", "Olu", "Sofia", "Liam", "Priya", "Tomas", "Aisha"]
+LAST_NAMES = ["Doe", "Sharma", "Garcia", "Chen", "Adeyemi", "Rossi", "Murphy", "Iyer", "Novak", "Khan"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli"]
+TITLES = ["Software Engineer", "Data Analyst", "Backend Developer", "Machine Learning Engineer",
+          "Frontend Developer", "Data Scientist", "DevOps Engineer"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+VERBS = ["Developed", "Built", "Led", "Designed", "Optimized", "Implemented", "Automated", "Delivered",
+         "Reduced", "Increased", "Launched", "Mentored", "Collaborated on", "Maintained"]
+OBJECTS = ["a payments API", "the data pipeline", "an internal dashboard", "CI/CD workflows",
+           "a recommendation service", "the reporting stack", "customer onboarding flows"]
+OUTCOMES = ["cutting latency by 40%", "serving 2M+ users", "saving $120k a year", "for 15+ clients",
+            "with 99.9% uptime", "ahead of schedule", "across 3 regions"]
+
+
+# Function to build the lines of one synthetic resume
+def resume_lines(rng, skills, n_pages=1, skill_density=0.3, years=5):
+    """
+    skill_density is the share of bullet points that name a skill; years is the
+    span the work history covers, split into jobs with "Mon YYYY - Mon YYYY"
+    ranges ending at Present.
+    """
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name.upper(),
+        f"{name.lower().replace(' ', '.')}@example.com | ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        f" | linkedin.com/in/{name.lower().replace(' ', '')} | github.com/{name.split()[0].lower()}",
+        "Summary",
+        f"{rng.choice(TITLES)} with {years} years of experience building reliable software.",
+        "Skills",
+        ", ".join(rng.sample(skills, min(len(skills), 10))),
+        "Work Experience",
+    ]
+
+    # Split the work history into jobs, most recent first
+    end_year, end_month, remaining = 2025, rng.randrange(12), max(1, years * 12)
+    jobs = []
+    while remaining > 0:
+        months = min(remaining, rng.randint(12, 40))
+        start = end_year * 12 + end_month - months
+        jobs.append((start // 12, start % 12, end_year, end_month, not jobs))
+        end_year, end_month = divmod(start - rng.randint(0, 3), 12)
+        remaining -= months
+
+    budget = n_pages * LINES_PER_PAGE - len(lines) - 12  # room left for bullets
+    per_job = max(2, budget // len(jobs))
+    for start_year, start_month, end_year, end_month, current in jobs:
+        end = "Present" if current else f"{MONTHS[end_month]} {end_year}"
+        lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}  {MONTHS[start_month]} {start_year} - {end}")
+        for _ in range(per_job):
+            bullet = f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+            if rng.random() < skill_density:
+                bullet += f" using {rng.choice(skills)}"
+            lines.append(f"{bullet}, {rng.choice(OUTCOMES)}")
+
+    lines += [
+        "Projects",
+        f"- Open source contributor to a {rng.choice(skills)} library",
+        "Education",
+        f"B.Tech in Computer Science, {end_year - rng.randint(0, 2)}",
+        "Certifications",
+        rng.choice(["AWS Certified Developer", "Certified Scrum Master", "Google Cloud Certified"]),
+        "Achievements",
+        "Awarded employee of the month, top performer in 2023",
+    ]
+    return lines
+
+
+def to_pdf(lines):
+    return write_pdf([lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)])
+
+
+def to_docx(lines):
+    from docx import Document
+
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+# Function to generate a corpus of synthetic resumes in memory
+def generate(count=20, seed=0, formats=("pdf", "docx"), pages=(1, 2, 3), densities=(0.1, 0.3, 0.6), years=(1, 4, 10)):
+    """
+    Returns a list of (file_name, file_bytes, spec) where spec records how the
+    resume was built. Page count, skill density, years of experience and format
+    cycle through the given values, so every combination is covered.
+    """
+    from parser import known_skills
+
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(count):
+        spec = {
+            "pages": pages[index % len(pages)],
+            "skill_density": densities[(index // len(pages)) % len(densities)],
+            "years": years[(index // (len(pages) * len(densities))) % len(years)],
+            "format": formats[index % len(formats)],
+        }
+        lines = resume_lines(rng, known_skills, spec["pages"], spec["skill_density"], spec["years"])
+        data = to_pdf(lines) if spec["format"] == "pdf" else to_docx(lines)
+        corpus.append((f"resume_{index:04d}.{spec['format']}", data, spec))
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus.")
+    parser.add_argument("directory")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.directory, exist_ok=True)
+    manifest = {}
+    for file_name, data, spec in generate(args.count, args.seed):
+        with open(os.path.join(args.directory, file_name), "wb") as f:
+            f.write(data)
+        manifest[file_name] = spec
+    with open(os.path.join(args.directory, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {len(manifest)} resumes to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
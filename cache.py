@@ -0,0 +1,112 @@
+import os
+import json
+import zlib
+import hashlib
+import tempfile
+
+CACHE_DIR = os.environ.get(
+    "RESUME_PARSER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "resume-parser"),
+)
+# Set RESUME_PARSER_CACHE_MAX_BYTES=0 to turn the cache off
+CACHE_MAX_BYTES = int(os.environ.get("RESUME_PARSER_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+class DiskCache:
+    """
+    Persistent key -> JSON value store. Entries are zlib-compressed files
+    named by key; a read refreshes the file's mtime, and once the directory
+    grows past max_bytes the least recently used entries are deleted.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size = None  # bytes on disk, counted lazily on first write
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = json.loads(zlib.decompress(f.read()))
+            os.utime(path)  # mark as recently used
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, ValueError) as e:
+            print(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        payload = zlib.compress(json.dumps(value).encode("utf-8"))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so concurrent workers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write cache entry {path}: {e}")
+            return
+
+        if self._size is None:
+            self._size = self._disk_usage()
+        else:
+            self._size += len(payload)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _disk_usage(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        # Drop the least recently used entries until we are back under 90% of the budget
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                size -= entry_size
+            except OSError:
+                continue
+        self._size = size
+
+
+# Function to build the cache key for an uploaded file
+def content_key(data, version):
+    digest = hashlib.sha256()
+    digest.update(str(version).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+# Separate directories so each cache evicts only its own entries
+resume_cache = DiskCache(os.path.join(CACHE_DIR, "resumes"))
+grammar_cache = DiskCache(os.path.join(CACHE_DIR, "grammar"), CACHE_MAX_BYTES // 16)
@@ -0,0 +1,119 @@
+"""
+Score resumes from the command line, without the Streamlit UI.
+
+    python cli.py resumes/ --category Experienced --role "Senior Software Developer" -o scores.jsonl
+
+Writes one JSON object per resume, as soon as it is scored: the score_resume
+result plus "file", "category" and "role", or "file" and "error" when the resume
+could not be processed. Exits with status 1 if any resume failed.
+"""
+import argparse
+import json
+import os
+import sys
+
+from utils import load_job_profiles
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+# Function to expand the command line paths into resume files
+def collect_files(paths, file_list=None, recursive=False):
+    """Directories contribute their .pdf/.docx files; file_list is a file of paths, one per line ("-" for stdin)."""
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        if recursive:
+            found = [os.path.join(root, name) for root, _, names in os.walk(path) for name in names]
+        else:
+            found = [os.path.join(path, name) for name in os.listdir(path)]
+        files.extend(sorted(name for name in found if name.lower().endswith(RESUME_EXTENSIONS)))
+    if file_list:
+        stream = sys.stdin if file_list == "-" else open(file_list)
+        with stream:
+            files.extend(line.strip() for line in stream if line.strip())
+    return files
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Score resumes against a job profile and write JSON lines.")
+    parser.add_argument("paths", nargs="*", help="resume files or directories of resumes")
+    parser.add_argument("--file-list", help="file with one resume path per line ('-' reads stdin)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="also search subdirectories")
+    parser.add_argument("--category", help="job profile category, e.g. Experienced")
+    parser.add_argument("--role", help="job profile role, e.g. 'Senior Software Developer'")
+    parser.add_argument("--profiles", default="job_profile.json", help="job profile JSON file")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="resumes handed to a worker at a time")
+    parser.add_argument("-o", "--output", default="-", help="JSON lines output file (default: stdout)")
+    parser.add_argument("--list-roles", action="store_true", help="print the available categories and roles and exit")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    job_profiles = load_job_profiles(args.profiles)
+
+    if args.list_roles:
+        for category, roles in job_profiles.items():
+            for role in roles:
+                print(f"{category}: {role}")
+        return 0
+
+    if args.role is None or args.category is None:
+        print("Both --category and --role are required (see --list-roles)", file=sys.stderr)
+        return 2
+    try:
+        job_profile = job_profiles[args.category][args.role]
+    except KeyError:
+        print(f"Unknown role '{args.category}: {args.role}' (see --list-roles)", file=sys.stderr)
+        return 2
+
+    files = collect_files(args.paths, args.file_list, args.recursive)
+    if not files:
+        print("No resumes to score", file=sys.stderr)
+        return 2
+
+    if args.output == "-":
+        # The parser reports problems with print(); keep the real stdout for the
+        # JSON lines and send fd 1, which worker processes inherit, to stderr
+        sys.stdout.flush()
+        output = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        os.dup2(2, 1)
+    else:
+        output = open(args.output, "w", encoding="utf-8")
+
+    # Explicitly named files that aren't resumes get an error record without
+    # being sent to a worker; workers read the rest themselves, so only paths are sent
+    resumes = [path for path in files if path.lower().endswith(RESUME_EXTENSIONS)]
+    failed = 0
+    try:
+        for path in files:
+            if not path.lower().endswith(RESUME_EXTENSIONS):
+                failed += 1
+                output.write(json.dumps({"file": path, "error": "Unsupported file format, must be a .pdf or .docx"}) + "\n")
+        output.flush()
+        if resumes:
+            # Imported here, not at the top: batch loads the spaCy model, which
+            # --list-roles, usage errors and runs without a resume don't need
+            from batch import iter_evaluate
+
+            for _, path, score_data, error in iter_evaluate([(path, path) for path in resumes], job_profile, args.workers, args.chunk_size):
+                if error is not None:
+                    failed += 1
+                    record = {"file": path, "error": error}
+                else:
+                    record = {"file": path, "category": args.category, "role": args.role, **score_data}
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+    finally:
+        output.close()
+
+    print(f"Scored {len(files) - failed} of {len(files)} resumes", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
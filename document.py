@@ -0,0 +1,60 @@
+from functools import cached_property
+
+from keywords import line_classifier
+
+
+class ResumeDocument:
+    """
+    Views of a resume's text that the scorers need over and over: the
+    lowercased text, its lines, the keyword families on each line, tokens and
+    word count. Each view is computed
+    once, on first use.
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def lines(self):
+        return self.text.split("\n")
+
+    @cached_property
+    def lower_lines(self):
+        return self.lower.split("\n")
+
+    @cached_property
+    def nonempty_lines(self):
+        """Stripped lines that are not blank."""
+        return [line.strip() for line in self.lines if line.strip() != ""]
+
+    @cached_property
+    def tokens(self):
+        return self.text.split()
+
+    @cached_property
+    def word_count(self):
+        return len(self.tokens)
+
+    @cached_property
+    def line_tags(self):
+        """One set of keyword family names per line, from a single scan of the text."""
+        return line_classifier.classify(self.text)
+
+    def reuse_line_tags(self, other):
+        """Copy line tags from a document this one shares lines with; only unseen lines are classified."""
+        # Tags do not depend on surrounding whitespace, so lines are compared stripped
+        known = {line.strip(): tags for line, tags in zip(other.lines, other.line_tags)}
+        unseen = list(dict.fromkeys(line.strip() for line in self.lines if line.strip() not in known))
+        known.update(zip(unseen, line_classifier.classify("\n".join(unseen))))
+        self.line_tags = [known[line.strip()] for line in self.lines]
+
+    def tagged_lines(self, family):
+        """Lines that mention a term of the given keyword family."""
+        return [line for line, tags in zip(self.lines, self.line_tags) if family in tags]
+
+    def has_tag(self, family):
+        return any(family in tags for tags in self.line_tags)
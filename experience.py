@@ -0,0 +1,151 @@
+import re
+from datetime import date
+
+# Month name (any prefix of at least three letters, plus "sept") -> month number
+MONTHS = {}
+for _number, _name in enumerate(["january", "february", "march", "april", "may", "june", "july",
+                                 "august", "september", "october", "november", "december"], 1):
+    for _end in range(3, len(_name) + 1):
+        MONTHS[_name[:_end]] = _number
+MONTHS["sept"] = 9
+
+ONGOING = {"present", "current", "currently", "now", "today", "date", "ongoing"}
+
+_YEAR = r"(?:19|20)\d{2}"
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+# One side of a range: "Mar 2021", "March, 2021", "03/2021", "3.2021" or a bare "2021"
+_DATE = rf"(?:{_MONTH},?\s+{_YEAR}|\d{{1,2}}\s*[/.]\s*{_YEAR}|{_YEAR})"
+# Matched against lowercased text; IGNORECASE makes every alternative twice as slow
+DATE_RANGE = re.compile(
+    rf"\b(?P<start>{_DATE})\s*(?:–|—|-|to|until|till)\s*"
+    rf"(?P<end>{_DATE}|(?:till\s+|to\s+)?(?:present|current(?:ly)?|now|today|date|ongoing))\b"
+)
+# Only lines with a year in them can hold a range, and most lines have none
+YEAR = re.compile(_YEAR)
+BARE_YEAR = re.compile(rf"{_YEAR}$")
+_PARTS = re.compile(rf"(?:(?P<month>[A-Za-z]+|\d{{1,2}})\W*)?(?P<year>{_YEAR})$")
+
+# Date ranges on these (lowercased) lines are studies, not work experience. Only
+# degree-level words count: a bare "master" or "academy" is as likely a job
+# ("Scrum Master") or an employer
+EDUCATION_LINE = re.compile(
+    r"\b(?:university|college|high\s+school|(?:bachelor|master)(?:'?s\b|\s+of\b)|degree|b\.?\s?tech|m\.?\s?tech|"
+    r"b\.?\s?sc|m\.?\s?sc|b\.e\b|mba\b|ph\.?d|gpa|cgpa|diploma|class\s+(?:x|xii|10|12)\b)"
+)
+# A range of bare years ("2019 - 2021") only counts with one of these on its
+# line or the line before, so a stray "Phone: 2019-2020" adds nothing
+ROLE_CONTEXT = re.compile(
+    r"\b(?:developer|engineer|programmer|analyst|scientist|researcher|consultant|manager|director|lead|head|"
+    r"architect|designer|administrator|specialist|associate|officer|executive|coordinator|technician|"
+    r"intern|internship|trainee|founder|freelance|master|owner|"
+    r"inc|ltd|llc|llp|corp|corporation|company|pvt|gmbh|technologies|solutions|labs?|systems|services)s?\b"
+)
+
+
+# Function to turn one side of a date range into a month index (year * 12 + month - 1)
+def parse_month(value, today=None):
+    """Returns None for text that isn't a date. A bare year is its January; "Present" and the like are today."""
+    value = value.strip().lower()
+    if value.split()[-1] in ONGOING:
+        today = today or date.today()
+        return today.year * 12 + today.month - 1
+
+    parts = _PARTS.match(value)
+    if not parts:
+        return None
+    year, month = int(parts.group("year")), parts.group("month")
+    if month is None:
+        month = 1
+    elif month.isdigit():
+        month = int(month)
+        if not 1 <= month <= 12:
+            return None
+    else:
+        month = MONTHS.get(month)
+        if month is None:
+            return None
+    return year * 12 + month - 1
+
+
+def _has_month(value):
+    return not (BARE_YEAR.match(value) or value.split()[-1] in ONGOING)
+
+
+# Function to find the (start, end, ongoing) month ranges in a text, ongoing ones ending "Present"
+def _find_ranges(text, today):
+    today = today or date.today()
+    now = today.year * 12 + today.month - 1
+    text = text.lower()
+    ranges = []
+    line_end = -1
+    for year in YEAR.finditer(text):
+        if year.start() < line_end:
+            continue  # this line was already scanned
+        line_start = text.rfind("\n", 0, year.start()) + 1
+        line_end = text.find("\n", year.end())
+        if line_end == -1:
+            line_end = len(text)
+        if EDUCATION_LINE.search(text, line_start, line_end):
+            continue
+        for match in DATE_RANGE.finditer(text, line_start, line_end):
+            if BARE_YEAR.match(match.group("start")) and not _has_month(match.group("end")):
+                context_start = text.rfind("\n", 0, max(line_start - 1, 0)) + 1
+                if not ROLE_CONTEXT.search(text, context_start, line_end):
+                    continue
+            start = parse_month(match.group("start"), today)
+            end = parse_month(match.group("end"), today)
+            if start is not None and end is not None and start < end <= now:
+                ranges.append((start, end, match.group("end").split()[-1] in ONGOING))
+    return ranges
+
+
+# Function to find the (start, end) month intervals of the date ranges in a text
+def find_intervals(text, today=None):
+    """
+    Ranges are half-open, so "Jan 2020 - Mar 2020" is two months and
+    "2018 - 2020" two years. A range must sit on one line. Ranges on
+    education lines, ranges that end before they start and ranges that end
+    in the future are skipped, as are ranges without a month unless their
+    line or the one before names a role or company (see ROLE_CONTEXT).
+    """
+    return [(start, end) for start, end, _ in _find_ranges(text, today)]
+
+
+# Function to add up intervals without counting overlapping time twice
+def merge_intervals(intervals):
+    """Sorts by start and sweeps once, so overlapping or touching roles merge."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+# Function to split a text's experience into settled months and a period still running
+def experience_span(text, today=None):
+    """
+    Returns (months, since): since is the month index the period running to
+    "Present" began, or None, and months the experience outside it. At any
+    later month m the experience is months + m - since, so it can be kept
+    current without reading the text again.
+    """
+    ranges = _find_ranges(text, today)
+    merged = merge_intervals((start, end) for start, end, _ in ranges)
+    months = sum(end - start for start, end in merged)
+    if not any(ongoing for _, _, ongoing in ranges):
+        return months, None
+    # Ongoing ranges all end today, so they belong to the last merged period
+    since, end = merged[-1]
+    return months - (end - since), since
+
+
+# Function to get the years of experience covered by the date ranges in a text
+def experience_years(text, today=None):
+    today = today or date.today()
+    months, since = experience_span(text, today)
+    if since is not None:
+        months += today.year * 12 + today.month - 1 - since
+    return round(months / 12, 1)
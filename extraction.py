@@ -0,0 +1,179 @@
+import io
+import os
+import zipfile
+import contextlib
+import multiprocessing
+from itertools import islice
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfplumber
+from pdfminer.layout import LAParams
+from pdfminer.converter import TextConverter
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+
+# Resumes are a page or two; stop reading long PDFs (publication lists,
+# portfolios) once either budget is used up. 0 means no limit
+PDF_MAX_PAGES = int(os.environ.get("RESUME_PARSER_PDF_MAX_PAGES", 10))
+PDF_MAX_CHARS = int(os.environ.get("RESUME_PARSER_PDF_MAX_CHARS", 50000))
+
+# PDFs with at least this many pages are split across worker processes (when
+# there is more than one worker). benchmarks/bench_pdf_pages.py measured about
+# 120 ms per dense page against a 5-25 ms worker round trip, so two pages
+# already break even; three leaves room for lighter pages. 0 turns parallel
+# extraction off
+PDF_PARALLEL_PAGES = int(os.environ.get("RESUME_PARSER_PDF_PARALLEL_PAGES", 3))
+PDF_PAGE_WORKERS = int(os.environ.get("RESUME_PARSER_PDF_PAGE_WORKERS", min(os.cpu_count() or 1, 4)))
+
+
+class ExtractionError(ValueError):
+    """Raised when no text can be read from a resume file."""
+
+
+# Function to get a binary stream over a path, an in-memory file or a file object
+def open_source(source):
+    """
+    Use as a context manager. Paths are opened (and closed afterwards); bytes
+    are wrapped in a BytesIO, which shares the buffer instead of copying it;
+    file objects are rewound and left open for the caller.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb")
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return contextlib.nullcontext(io.BytesIO(source))
+    source.seek(0)
+    return contextlib.nullcontext(source)
+
+
+# Function to tell a PDF from a DOCX by the file's first bytes rather than its name
+def detect_format(source):
+    """Returns "pdf", "docx" or None."""
+    with open_source(source) as stream:
+        head = stream.read(1024)
+        stream.seek(0)
+        if b"%PDF-" in head:  # the header may follow a little leading junk
+            return "pdf"
+        if head.startswith(b"PK\x03\x04"):  # a zip archive; DOCX if it holds a Word document
+            try:
+                with zipfile.ZipFile(stream) as archive:
+                    if "word/document.xml" in archive.namelist():
+                        return "docx"
+            except zipfile.BadZipFile:
+                return None
+    return None
+
+
+def _page_text(page):
+    text = page.extract_text()
+    page.close()  # drop the page's cached characters and layout before moving on
+    return text
+
+
+# Function to extract the text of pages first..last (1-based, inclusive) of a PDF
+def extract_page_range(source, first, last):
+    with open_source(source) as stream, pdfplumber.open(stream, pages=range(first, last + 1)) as pdf:
+        return [_page_text(page) for page in pdf.pages]
+
+
+# Function to get the worker pool for page extraction, started on first use
+@lru_cache(maxsize=1)
+def page_pool(max_workers=PDF_PAGE_WORKERS):
+    # spawn rather than fork for the same reason as batch.iter_evaluate; this
+    # module does not import spaCy, so workers start in well under a second
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def _page_ranges(page_count, parts):
+    # Split pages 1..page_count into at most `parts` contiguous, near-equal ranges
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges, first = [], 1
+    for part in range(parts):
+        last = first + size - 1 + (1 if part < extra else 0)
+        ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+def _within_budget(page_texts, max_chars):
+    chars = 0
+    for page_text in page_texts:
+        if not page_text:
+            continue
+        yield page_text
+        chars += len(page_text)
+        if max_chars and chars >= max_chars:
+            break
+
+
+# Function to read the text of a PDF page by page, within the page and character budgets
+def iter_pdf_pages(source, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, parallel=None):
+    """
+    source is a path, the PDF's bytes or a binary file object. Yields the text
+    of each non-empty page in order. parallel=None extracts
+    pages in worker processes when the PDF has at least PDF_PARALLEL_PAGES
+    pages to read; True or False forces the choice.
+    """
+    pages = range(1, max_pages + 1) if max_pages else None
+    with open_source(source) as stream, pdfplumber.open(stream, pages=pages) as pdf:
+        page_count = len(pdf.pages)
+        if parallel is None:
+            parallel = 0 < PDF_PARALLEL_PAGES <= page_count and PDF_PAGE_WORKERS > 1
+        if not parallel:
+            yield from _within_budget(map(_page_text, pdf.pages), max_chars)
+            return
+        if not isinstance(source, (str, os.PathLike, bytes)):
+            stream.seek(0)
+            source = stream.read()  # workers need something they can unpickle
+
+    with contextlib.closing(_iter_worker_pages(source, page_count)) as page_texts:
+        yield from _within_budget(page_texts, max_chars)
+
+
+def _iter_worker_pages(source, page_count):
+    # Each worker opens the file itself and reads one contiguous range of pages.
+    # There are two ranges per worker, one per worker in flight: the next range
+    # is only submitted once the one before has been read in order, so when the
+    # character budget runs out the remaining ranges are never read
+    ranges = iter(_page_ranges(page_count, PDF_PAGE_WORKERS * 2))
+    pending = deque(
+        page_pool().submit(extract_page_range, source, first, last)
+        for first, last in islice(ranges, PDF_PAGE_WORKERS)
+    )
+    try:
+        while pending:
+            yield from pending.popleft().result()
+            for first, last in islice(ranges, 1):
+                pending.append(page_pool().submit(extract_page_range, source, first, last))
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# Function to read the text of a PDF page by page with bare pdfminer, within the same budgets
+def iter_pdfminer_pages(source, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS):
+    """
+    Text-only alternative to iter_pdf_pages. pdfplumber keeps an object for
+    every character so it can rebuild the layout; this converts each page
+    straight to text, with pdfminer's reading-order analysis (boxes_flow)
+    turned off so lines come out in the order they appear on the page.
+    """
+    laparams = LAParams(boxes_flow=None, detect_vertical=False, all_texts=False)
+    resources = PDFResourceManager(caching=True)
+    with open_source(source) as stream:
+        pages = PDFPage.get_pages(stream, maxpages=max_pages)
+        yield from _within_budget((_pdfminer_page_text(page, resources, laparams) for page in pages), max_chars)
+
+
+def _pdfminer_page_text(page, resources, laparams):
+    output = io.StringIO()
+    device = TextConverter(resources, output, laparams=laparams)
+    try:
+        PDFPageInterpreter(resources, device).process_page(page)
+    finally:
+        device.close()
+    # TextConverter ends every page with a form feed; strip it and the trailing newline
+    return output.getvalue().rstrip("\x0c").rstrip("\n")
@@ -0,0 +1,152 @@
+import os
+import re
+import sys
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import grammar_cache, content_key
+
+# "languagetool" calls the public LanguageTool HTTP API; "local" checks spelling
+# in-process with pyspellchecker and never touches the network
+GRAMMAR_BACKEND = os.environ.get("RESUME_PARSER_GRAMMAR_BACKEND", "languagetool")
+
+LANGUAGETOOL_URL = os.environ.get("LANGUAGETOOL_URL", "https://api.languagetool.org/v2/check")
+GRAMMAR_TIMEOUT = float(os.environ.get("RESUME_PARSER_GRAMMAR_TIMEOUT", 10))
+GRAMMAR_CONCURRENCY = int(os.environ.get("RESUME_PARSER_GRAMMAR_CONCURRENCY", 4))
+GRAMMAR_CHUNK_CHARS = 4000
+
+# The bundled profiles, found next to this module whatever the working directory
+JOB_PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_profile.json")
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z'-]*[A-Za-z]|[A-Za-z]")
+# Emails, URLs and profile handles are made of names, not dictionary words
+_LINK = re.compile(r"\S+@\S+|(?:https?://|www\.)\S+|\b[\w.-]+\.(?:com|org|io|dev|net|in|me)/\S*", re.IGNORECASE)
+
+# Everyday resume and engineering words missing from pyspellchecker's dictionary
+RESUME_VOCABULARY = [
+    "api", "apis", "backend", "backends", "frontend", "frontends", "fullstack", "devops", "devsecops", "sre",
+    "github", "gitlab", "bitbucket", "linkedin", "leetcode", "hackerrank", "kaggle", "stackoverflow",
+    "uptime", "downtime", "workflow", "workflows", "microservice", "microservices", "monorepo", "repo", "repos",
+    "codebase", "codebases", "config", "configs", "runtime", "runtimes", "middleware", "dataset", "datasets",
+    "dashboard", "dashboards", "onboarding", "onboarded", "stakeholder", "stakeholders", "scalability",
+    "deployable", "refactor", "refactored", "refactoring", "toolchain", "toolchains", "pipelines", "async",
+    "cron", "webhook", "webhooks", "throughput", "latencies", "failover", "autoscaling", "hackathon",
+    "hackathons", "internship", "internships", "mentored", "mentoring", "upskilled", "cross-functional",
+    "e-commerce", "ecommerce", "fintech", "edtech", "saas", "paas", "iaas", "sdk", "sdks", "cli", "ux", "ui",
+]
+
+
+def split_chunks(text, max_chars):
+    """Split text at line breaks into chunks of at most max_chars characters."""
+    chunks, current, size = [], [], 0
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_chars:
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and size + len(line) > max_chars:
+            chunks.append("".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        chunks.append("".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+class LanguageToolClient:
+    """
+    Counts grammar issues with a LanguageTool server. The whole document is
+    split into chunks that are checked in parallel over one pooled HTTP
+    session, with at most max_concurrency requests in flight and a timeout on
+    each. Per-chunk results are cached on disk by text hash, so re-checking an
+    unchanged resume makes no requests at all. Point LANGUAGETOOL_URL at a
+    local server to run without the public API.
+    """
+
+    def __init__(self, url=LANGUAGETOOL_URL, language="en-US", timeout=GRAMMAR_TIMEOUT,
+                 max_concurrency=GRAMMAR_CONCURRENCY, chunk_chars=GRAMMAR_CHUNK_CHARS, cache=grammar_cache):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url
+        self.language = language
+        self.timeout = timeout
+        self.chunk_chars = chunk_chars
+        self.cache = cache
+        self._cache_version = f"languagetool|{url}|{language}"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="languagetool")
+
+    def _check_chunk(self, chunk):
+        key = content_key(chunk.encode("utf-8"), self._cache_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = self.session.post(self.url, data={"text": chunk, "language": self.language}, timeout=self.timeout)
+        response.raise_for_status()
+        count = len(response.json().get("matches", []))
+        self.cache.set(key, count)
+        return count
+
+    def __call__(self, text):
+        chunks = split_chunks(text, self.chunk_chars)
+        try:
+            return sum(self._pool.map(self._check_chunk, chunks))
+        except Exception as e:
+            print(f"Grammar API failed: {e}", file=sys.stderr)
+            return None
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+        self.session.close()
+
+
+# Function to build the words spell checking should accept: skills and job profile terms
+@lru_cache(maxsize=1)
+def tech_vocabulary():
+    from parser import known_skills
+    from utils import load_job_profiles, TERM_FIELDS
+
+    terms = list(known_skills)
+    try:
+        for roles in load_job_profiles(JOB_PROFILES_PATH).values():
+            for profile in roles.values():
+                for field in TERM_FIELDS:
+                    terms.extend(profile.get(field, []))
+    except FileNotFoundError as e:
+        print(f"Spell checker vocabulary built without job profiles: {e}")
+    return frozenset(word.lower() for term in terms for word in _WORD.findall(term))
+
+
+class SpellingChecker:
+    """
+    Offline stand-in for the LanguageTool check: counts misspelled words with
+    pyspellchecker. Only lowercase words are checked, since capitalised ones are
+    mostly names of people, companies and products that no dictionary knows,
+    and emails and links are skipped for the same reason.
+    """
+
+    def __init__(self, vocabulary=()):
+        from spellchecker import SpellChecker
+
+        self._speller = SpellChecker()
+        self._speller.word_frequency.load_words(RESUME_VOCABULARY)
+        self._speller.word_frequency.load_words(vocabulary)
+
+    def __call__(self, text):
+        words = [word for word in _WORD.findall(_LINK.sub(" ", text)) if len(word) > 2 and word.islower()]
+        unknown = self._speller.unknown(words)
+        return sum(1 for word in words if word in unknown)
+
+
+# Function to get the grammar checker for a backend, built once per process
+@lru_cache(maxsize=None)
+def get_grammar_checker(backend=GRAMMAR_BACKEND):
+    if backend == "languagetool":
+        return LanguageToolClient()
+    if backend == "local":
+        return SpellingChecker(tech_vocabulary())
+    raise ValueError(f"Unknown grammar backend '{backend}': must be 'languagetool' or 'local'")
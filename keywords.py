@@ -0,0 +1,52 @@
+from matcher import LineClassifier
+
+# Keyword families the scorers and the parser look for, line by line
+action_verbs = {
+    "led", "developed", "implemented", "created", "designed",
+    "managed", "built", "optimized", "launched", "streamlined",
+    "executed", "increased", "reduced", "automated", "delivered"
+}
+achievement_verbs = [
+    "accelerated", "boosted", "cut", "drove", "enhanced", "exceeded", "generated",
+    "optimized", "streamlined", "transformed", "led", "initiated", "launched",
+    "executed", "revamped", "overhauled", "achieved", "surpassed", "secured",
+    "managed", "mentored", "solved", "won", "closed", "built", "automated"
+]
+recognitions = ["awarded", "recognized", "certified", "nominated", "winner", "top performer",
+                "appreciated", "honored", "commendation", "employee of the month", "ranked"]
+job_titles = ["developer", "engineer", "analyst", "researcher", "consultant", "manager"]
+impact_keywords = ["launched", "delivered", "increased", "optimized", "boosted", "reduced"]
+cert_keywords = ["aws", "gcp", "azure", "pmp", "credential", "completed",
+                 "certified", "certification", "badge", "course", "aws certified",
+                 "microsoft certified", "google cloud certified", "scrum master",
+                 "six sigma", "cissp", "cka", "ckad", "csm", "ccnp", "ccie"]
+# Regexes rather than literal terms; each is matched within a single line
+cert_patterns = [r"completed .* course", r"earned .* certificate"]
+experience_keywords = [
+    "years of experience", "developed", "built", "engineered",
+    "implemented", "designed", "optimized", "worked on",
+    "responsible for", "managed", "led", "coordinated",
+    "supervised", "directed", "coached", "trained", "mentored",
+    "collaborated", "contributed", "participated in", "involved in"
+]
+side_project_keywords = ["github", "open source"]
+online_presence_keywords = ["linkedin", "github", "portfolio"]
+
+# Terms match whole words, so "led" no longer fires inside "skilled" and
+# "cka" inside "hackathon"; these endings are allowed, so "engineer" still
+# counts in "Engineers" and "Engineering", and "certification" in "Certifications"
+KEYWORD_SUFFIXES = ("s", "es", "ing", "ed")
+line_classifier = LineClassifier(
+    {
+        "action_verb": action_verbs,
+        "achievement": achievement_verbs + recognitions,
+        "job_title": job_titles,
+        "impact": impact_keywords,
+        "certification": cert_keywords,
+        "experience": experience_keywords,
+        "side_project": side_project_keywords,
+        "online_presence": online_presence_keywords,
+    },
+    {"certification": cert_patterns},
+    KEYWORD_SUFFIXES,
+)
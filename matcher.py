@@ -0,0 +1,142 @@
+import re
+from bisect import bisect_right
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _trie_pattern(node):
+    # Turn a character trie into a regex, so shared prefixes are only tested once
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch != ""]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+class KeywordMatcher:
+    """
+    Finds every occurrence of a fixed set of terms in one pass over the text.
+
+    Matching is case-insensitive and respects word boundaries, so "Java" does
+    not match inside "JavaScript". suffixes are endings a term may carry and
+    still match, e.g. ("s",) to find "API" in "APIs". The terms are compiled
+    once into a single trie-shaped regex wrapped in a lookahead, which reports
+    overlapping matches ("Machine Learning" and "Learning") as well as nested
+    ones that start at the same offset ("API" and "API Design").
+    """
+
+    def __init__(self, terms, suffixes=()):
+        self.terms = list(dict.fromkeys(terms))
+        self._canonical = {}
+        trie = {}
+        for term in self.terms:
+            key = term.lower()
+            if not key or key in self._canonical:
+                continue
+            self._canonical[key] = term
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        # The regex only reports the longest term at each offset, so remember
+        # which shorter terms are word-bounded prefixes of each longer one
+        self._nested = {}
+        for key in self._canonical:
+            prefixes = [
+                key[:i] for i in range(1, len(key))
+                if not _WORD_CHAR.match(key[i]) and key[:i] in self._canonical
+            ]
+            if prefixes:
+                self._nested[key] = prefixes
+
+        # The suffix sits outside the captured group, so a match still reports the bare term
+        suffix = ""
+        if suffixes:
+            suffix = "(?:" + "|".join(re.escape(ending) for ending in sorted(suffixes, key=len, reverse=True)) + ")?"
+        if self._canonical:
+            pattern = r"(?=(?<!\w)(" + _trie_pattern(trie) + ")" + suffix + r"(?!\w))"
+            self._regex = re.compile(pattern)
+            self._regex_ignorecase = re.compile(pattern, re.IGNORECASE)
+        else:
+            self._regex = None
+
+    def _matches(self, text):
+        # Scanning a lowercased copy is about twice as fast as re.IGNORECASE, but
+        # only keeps offsets valid when lowercasing does not change the length
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return self._regex.finditer(lowered)
+        return self._regex_ignorecase.finditer(text)
+
+    def finditer(self, text):
+        """Yield (start, end, term) for every match, in order of start offset."""
+        if self._regex is None:
+            return
+        for match in self._matches(text):
+            key = match.group(1).lower()
+            if key not in self._canonical:
+                continue
+            start = match.start(1)
+            for nested in self._nested.get(key, ()):
+                yield start, start + len(nested), self._canonical[nested]
+            yield start, match.end(1), self._canonical[key]
+
+    def findall(self, text):
+        """Return the set of lowercased terms that occur in text."""
+        found = set()
+        if self._regex is None:
+            return found
+        for match in self._matches(text):
+            key = match.group(1).lower()
+            if key in self._canonical:
+                found.add(key)
+                found.update(self._nested.get(key, ()))
+        return found
+
+    def __contains__(self, term):
+        return term.lower() in self._canonical
+
+    def __len__(self):
+        return len(self._canonical)
+
+
+class LineClassifier:
+    """
+    Tags every line of a text with the keyword families it mentions, in one
+    scan. families maps a family name to literal terms (matched like
+    KeywordMatcher terms); patterns maps a family name to lowercase regexes,
+    each matched within a single line of the lowercased text. suffixes are
+    the word endings a term may carry, as for KeywordMatcher.
+    """
+
+    def __init__(self, families, patterns=None, suffixes=()):
+        self._families = {}
+        for family, terms in families.items():
+            for term in terms:
+                self._families.setdefault(term.lower(), set()).add(family)
+        self._matcher = KeywordMatcher((term for terms in families.values() for term in terms), suffixes)
+        self._patterns = [
+            (family, re.compile("|".join(f"(?:{regex})" for regex in regexes)))
+            for family, regexes in (patterns or {}).items() if regexes
+        ]
+
+    def classify(self, text):
+        """Return one set of family names per line of text.split("\\n")."""
+        # Lowercasing can change the length of a line but never the number of lines
+        lowered = text.lower()
+        line_starts = [0]
+        position = lowered.find("\n")
+        while position != -1:
+            line_starts.append(position + 1)
+            position = lowered.find("\n", position + 1)
+        tags = [set() for _ in line_starts]
+
+        for start, _, term in self._matcher.finditer(lowered):
+            tags[bisect_right(line_starts, start) - 1].update(self._families[term.lower()])
+        for family, regex in self._patterns:
+            for match in regex.finditer(lowered):
+                tags[bisect_right(line_starts, match.start()) - 1].add(family)
+        return tags
@@ -1,36 +1,114 @@
-import pdfplumber
 import os
 from docx import Document
 import spacy
-import spacy
-nlp = spacy.load("en_core_web_sm")
 import re
+from matcher import KeywordMatcher
+from keywords import line_classifier
+import extraction
+from extraction import iter_pdf_pages, iter_pdfminer_pages, open_source, detect_format, ExtractionError
+from pdfminer.pdfparser import PDFSyntaxError
+from pdfplumber.utils.exceptions import PdfminerException
+from docx.opc.exceptions import OpcError
+
+# "ner" loads only what doc.ents needs (all extract_entities reads),
+# "fast" swaps the dependency parser for the rule-based sentencizer, and
+# "full" loads the whole en_core_web_sm pipeline
+NLP_MODE = os.environ.get("RESUME_PARSER_NLP_MODE", "ner")
+# ner follows the parser's sentence boundaries, so the parser stays for entities
+# to match the full pipeline; "fast" gives that up (see benchmarks/bench_nlp.py
+# for its speed and how many entities still match)
+NER_UNUSED_PIPES = ["tagger", "senter", "attribute_ruler", "lemmatizer"]
+
+# Function to load the spaCy model with only the components a mode needs
+def load_nlp(mode=NLP_MODE, model="en_core_web_sm"):
+    if mode == "full":
+        return spacy.load(model)
+    if mode not in ("ner", "fast"):
+        raise ValueError(f"Unknown NLP mode '{mode}': must be 'ner', 'fast' or 'full'")
+    if mode == "fast":
+        nlp = spacy.load(model, exclude=NER_UNUSED_PIPES + ["parser"])
+        nlp.add_pipe("sentencizer", first=True)
+    else:
+        nlp = spacy.load(model, exclude=NER_UNUSED_PIPES)
+    # Keep the shared tok2vec only while a remaining component listens to it
+    if "tok2vec" in nlp.pipe_names and not nlp.get_pipe("tok2vec").listening_components:
+        nlp.remove_pipe("tok2vec")
+    return nlp
+
+nlp = load_nlp()
+# Default number of texts nlp.pipe processes together in extract_entities_batch
+NER_BATCH_SIZE = 32
+# Name detection only looks at this header window; set RESUME_PARSER_FULL_NER=1
+# to run NER over the whole document instead, as older versions did
+NAME_HEADER_LINES = 8
+NAME_HEADER_CHARS = 600
+FULL_DOCUMENT_NER = os.environ.get("RESUME_PARSER_FULL_NER", "0") == "1"
+
+# Bump whenever extract_text, clean_text or extract_entities change their output,
+# so cached parses from older versions are not reused
+PARSER_VERSION = "8"
+
+# PDF text extraction backends, each yielding the text of one page at a time.
+# "pdfplumber" rebuilds the page layout from every character; "pdfminer" is a
+# lighter text-only conversion. If the chosen backend finds no text, the others
+# are tried in turn
+PDF_BACKENDS = {
+    "pdfplumber": iter_pdf_pages,
+    "pdfminer": iter_pdfminer_pages,
+}
+PDF_BACKEND = os.environ.get("RESUME_PARSER_PDF_BACKEND", "pdfplumber")
+
+# Function to describe everything that shapes a parse, for keying cached parses on
+def parser_settings_fingerprint():
+    """
+    PARSER_VERSION plus every setting that changes what extract_text or
+    extract_entities return, so changing any of them misses the cache
+    instead of serving parses made under the old settings.
+    """
+    settings = [
+        PARSER_VERSION, PDF_BACKEND, extraction.PDF_MAX_PAGES, extraction.PDF_MAX_CHARS,
+        NLP_MODE, f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}",
+        FULL_DOCUMENT_NER, NAME_HEADER_LINES, NAME_HEADER_CHARS,
+    ]
+    return "|".join(str(setting) for setting in settings)
+
+# Function to extract the text of a PDF with the configured backend, falling back to the others
+def extract_pdf_text(source, backend=PDF_BACKEND):
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}': must be one of {', '.join(PDF_BACKENDS)}")
+    for name in [backend] + [name for name in PDF_BACKENDS if name != backend]:
+        text = "".join(page_text + "\n" for page_text in PDF_BACKENDS[name](source))
+        if text.strip():
+            return text
+    return ""
+
 # Function to extract text from a PDF or DOCX file
-def extract_text(file_path: str) -> str:
-    ext = os.path.splitext(file_path)[1].lower() # function to get file extension
-    # Read the file based on its extension
-    text = ""
+def extract_text(source, name=None) -> str:
+    """
+    source is a path, the file's bytes or a binary file object; the format is
+    detected from its first bytes. name labels the file in error messages.
+    Raises ExtractionError when the file can't be read, so callers report it
+    instead of scoring an empty resume.
+    """
+    if name is None:
+        name = os.fspath(source) if isinstance(source, (str, os.PathLike)) else "uploaded file"
     try:
-        if ext == ".pdf": 
-            with pdfplumber.open(file_path) as pdf: # use pdfplumber to read pdf
-                for page in pdf.pages:
-                    page_text = page.extract_text() 
-                    if page_text:
-                        text += page_text + "\n"
-        elif ext == ".docx":
-            for para in Document(file_path).paragraphs: # use python-docx to read docx
-                text += para.text + "\n"
+        file_format = detect_format(source) # function to get file format
+        if file_format == "pdf":
+            text = extract_pdf_text(source) # use pdfplumber or pdfminer to read pdf
+        elif file_format == "docx":
+            with open_source(source) as stream: # use python-docx to read docx
+                text = "".join(para.text + "\n" for para in Document(stream).paragraphs)
         else:
-            raise ValueError("Unsupported file format: Must be a .pdf or .docx")
-    except pdfplumber.pdfa.PDFSyntaxError:
-        print(f"Error: Could not process the PDF file, it may be corrupted or malformed: {file_path}")
-        return ""
-    except OpcError:
-        print(f"Error: Could not process the DOCX file, it may be corrupted: {file_path}")
-        return ""
+            raise ExtractionError(f"Unsupported file format, must be a .pdf or .docx: {name}")
+    except ExtractionError:
+        raise
+    except (PDFSyntaxError, PdfminerException) as e:
+        raise ExtractionError(f"Could not process the PDF file, it may be corrupted or malformed: {name}") from e
+    except OpcError as e:
+        raise ExtractionError(f"Could not process the DOCX file, it may be corrupted: {name}") from e
     except Exception as e:
-        print(f"An unexpected error occurred while extracting text from {file_path}: {e}")
-        return ""
+        raise ExtractionError(f"An unexpected error occurred while extracting text from {name}: {e}") from e
     return text
 # Function to get a specific section of text
 def extract_sections(text):
@@ -51,11 +129,81 @@ def extract_sections(text):
 
     return section_map
 
+# Words that show a header line is a title, heading or contact detail rather than a name
+NOT_NAME_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "profile", "summary", "objective", "contact",
+    "information", "details", "address", "phone", "email", "mobile", "linkedin", "github",
+    "education", "experience", "work", "skills", "projects", "achievements", "certifications",
+    "engineer", "developer", "analyst", "manager", "scientist", "designer", "consultant",
+    "intern", "student", "researcher", "architect", "administrator", "specialist", "lead",
+    "senior", "junior", "software", "data", "web", "full", "stack", "university", "college",
+    # section headings
+    "about", "me", "personal", "statement", "career", "professional", "overview", "background",
+    "employment", "history", "qualifications", "references", "languages", "interests", "hobbies",
+    "declaration", "portfolio", "introduction",
+    # organisations
+    "inc", "ltd", "llc", "llp", "plc", "corp", "corporation", "company", "co", "group", "limited",
+    "gmbh", "pvt", "technologies", "solutions", "labs", "systems", "services", "institute",
+    # places
+    "city", "town", "county", "state", "states", "street", "road", "avenue", "district",
+    "province", "united", "kingdom", "usa", "india", "remote",
+}
+# A first line made only of these is a document title; the name may be on the next line
+DOCUMENT_TITLE_WORDS = {"resume", "résumé", "curriculum", "vitae", "cv", "of"}
+_NAME_LINE = re.compile(r"[A-Z][A-Za-z'.-]*(?:\s+[A-Z][A-Za-z'.-]*){1,3}")
+_HEADER_SEPARATORS = re.compile(r"\s*(?:[|•●,]|\s[-–]\s)\s*")
+
+# Function to get the first lines of a resume, where the candidate's name almost always is
+def header_window(text):
+    lines = text.split("\n", NAME_HEADER_LINES)[:NAME_HEADER_LINES]
+    return "\n".join(lines)[:NAME_HEADER_CHARS]
+
+# Function to find the name with cheap header heuristics; returns None when unsure
+def guess_name(text):
+    """
+    Only the first line of the header is considered (after a document title
+    such as "Resume"): further down, capitalised lines are as likely to be
+    headings, employers or places, which are left to NER.
+    """
+    for line in header_window(text).split("\n"):
+        line = line.strip()
+        if not line or all(word.strip(".:").lower() in DOCUMENT_TITLE_WORDS for word in line.split()):
+            continue
+        # "JOHN SMITH | john@mail.com" -> "JOHN SMITH"
+        candidate = _HEADER_SEPARATORS.split(line, 1)[0]
+        if not _NAME_LINE.fullmatch(candidate):
+            return None
+        if any(word.strip(".").lower() in NOT_NAME_WORDS for word in candidate.split()):
+            return None
+        return candidate.title() if candidate.isupper() else candidate
+    return None
+
 # Function to extract entities from text
-def extract_entities(text):
-    # Preprocess the text
-    doc = nlp(text)
+def extract_entities(text, full_ner=FULL_DOCUMENT_NER):
+    if full_ner:
+        return entities_from_doc(text, nlp(text))
+    # Try the header heuristics first and only run NER over the header when they fail
+    name = guess_name(text)
+    doc = nlp(header_window(text)) if name is None else None
+    return entities_from_doc(text, doc, name)
 
+# Function to extract entities from many texts, letting spaCy batch the NER work
+def extract_entities_batch(texts, batch_size=NER_BATCH_SIZE, n_process=1, full_ner=FULL_DOCUMENT_NER):
+    texts = list(texts)
+    if full_ner:
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [entities_from_doc(text, doc) for text, doc in zip(texts, docs)]
+
+    names = [guess_name(text) for text in texts]
+    unnamed = [position for position, name in enumerate(names) if name is None]
+    docs = [None] * len(texts)
+    windows = (header_window(texts[position]) for position in unnamed)
+    for position, doc in zip(unnamed, nlp.pipe(windows, batch_size=batch_size, n_process=n_process)):
+        docs[position] = doc
+    return [entities_from_doc(text, doc, name) for text, doc, name in zip(texts, docs, names)]
+
+# Function to build the extract_entities result from a text and, when NER ran, its spaCy doc
+def entities_from_doc(text, doc, name=None):
     # Create a dictionary to store the extracted data
     data ={
     "name": [],
@@ -71,9 +219,12 @@ def extract_entities(text):
 }
 
     # Extract entities and store them in the dictionary
-    for word in doc.ents:
-        if word.label_ == "PERSON" and not data["name"]:
-            data["name"].append(word.text)
+    if name:
+        data["name"].append(name)
+    elif doc is not None:
+        for word in doc.ents:
+            if word.label_ == "PERSON" and not data["name"]:
+                data["name"].append(word.text)
             
     if not data["name"]:# if spacy is unable to extract name, use regex
         lines = text.split('\n')
@@ -116,21 +267,14 @@ def extract_entities(text):
     
     # extract experience
     lines = text.split("\n")
-    summary_exp = [line.strip() for line in lines if looks_like_experience(line)]
+    summary_exp = [line.strip() for line, tags in zip(lines, line_classifier.classify(text)) if "experience" in tags]
     data["experience"].extend(summary_exp)
 
 
 
     return data
 def looks_like_experience(line):
-    keywords = [
-        "years of experience", "developed", "built", "engineered",
-        "implemented", "designed", "optimized", "worked on",
-        "responsible for", "managed", "led", "coordinated",
-        "supervised", "directed", "coached", "trained","mentored",
-        "collaborated", "contributed", "participated in", "involved in"
-    ]
-    return any(keyword in line.lower() for keyword in keywords)
+    return "experience" in line_classifier.classify(line)[0]
 
 known_skills = [
     "Python", "Java", "C++", "JavaScript", "HTML", "CSS",
@@ -148,12 +292,18 @@ known_skills = [
     "Cloud Computing", "Cloud Security", "Cloud Migration", "Cloud Deployment", "Cloud Management", "Cloud Monitoring",
     "Cloud Cost Optimization", "Cloud Scalability", "Cloud Reliability", "Cloud Performance", "Cloud Migration"
 ]
+_skill_matchers = {}
+
+# Function to get the compiled matcher for a skill list, building it on first use
+def skill_matcher(known_skills):
+    key = tuple(known_skills)
+    if key not in _skill_matchers:
+        _skill_matchers[key] = KeywordMatcher(key)
+    return _skill_matchers[key]
+
 def extract_skills(text, known_skills):
-    skills = []
-    for skill in known_skills:
-        if skill.lower() in text.lower():
-            skills.append(skill)
-    return skills
+    found = skill_matcher(known_skills).findall(text)
+    return [skill for skill in known_skills if skill.lower() in found]
 
 def clean_text(text):
     # Replace known icons if needed (optional)
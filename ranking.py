@@ -0,0 +1,45 @@
+import heapq
+
+
+class TopN:
+    """
+    Keeps only the best n (name, score, details) results seen so far, so a
+    streaming batch needs memory for n score dicts rather than the whole batch.
+    """
+
+    def __init__(self, n, min_score=0):
+        self.n = n
+        self.min_score = min_score
+        self.seen = 0
+        self.qualified = 0
+        self._heap = []  # min-heap of (score, -order, name, details)
+
+    def push(self, name, score, details, order=None):
+        """
+        Offer a result; returns True if the leaderboard changed. order is the
+        upload position used to break ties (defaults to arrival order).
+        """
+        if order is None:
+            order = self.seen
+        self.seen += 1
+        if score < self.min_score or self.n <= 0:
+            return False
+        self.qualified += 1
+
+        # Among equal scores the earlier upload wins, hence -order
+        entry = (score, -order, name, details)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self):
+        """Current leaderboard as (name, score, details), best first."""
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [(name, score, details) for score, _, name, details in ranked]
+
+    def __len__(self):
+        return len(self._heap)
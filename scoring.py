@@ -1,31 +1,53 @@
 import re
-import dateutil.parser
-from dateutil.relativedelta import relativedelta
-def score_resume(resume_data, job_profile, text, file_extension="pdf"):
+from functools import cached_property
+from utils import compile_job_profile
+from grammar import get_grammar_checker, GRAMMAR_BACKEND
+from document import ResumeDocument
+from timing import StageTimer
+from experience import experience_years
+
+# Grammar issue thresholds are per this many characters (about a page), so a
+# long resume isn't marked down just for having more words to check
+GRAMMAR_PAGE_CHARS = 2000
+
+def score_resume(resume_data, job_profile, text, file_extension="pdf", features=None, timer=None):
+    job_profile = compile_job_profile(job_profile)
+    if timer is None:
+        timer = StageTimer()
+    if features is None:
+        features = ResumeFeatures(resume_data, text, file_extension, timer)
     score = 0
     breakdown = {}
 
     # 1. Content Scoring
-    content_score, content_breakdown = score_content(resume_data, job_profile)
+    with timer.stage("score_content"):
+        content_score, content_breakdown = score_content(resume_data, job_profile, features)
     score += content_score
     breakdown['content'] = content_breakdown
 
     # 2. Formatting Scoring
-    formatting_score, formatting_breakdown = score_formatting(text, resume_data, file_extension)
+    with timer.stage("score_formatting"):
+        formatting_score, formatting_breakdown = features.formatting
     score += formatting_score
     breakdown['formatting'] = formatting_breakdown
     
 
     # 3. Optimization Scoring
-    optimization_score, optimization_breakdown = score_optimization(text, job_profile)
+    with timer.stage("score_optimization"):
+        optimization_score, optimization_breakdown = score_optimization(text, job_profile, features)
     score += optimization_score
     breakdown['optimization'] = optimization_breakdown
 
     # 4. Alignment Scoring
-    alignment_score, alignment_breakdown = score_alignment(text, resume_data, job_profile)
+    with timer.stage("score_alignment"):
+        alignment_score, alignment_breakdown = score_alignment(text, resume_data, job_profile, features)
     score += alignment_score
     breakdown['alignment'] = alignment_breakdown
 
+    # Precomputed features time their stages (grammar_check) on their own timer
+    if features.timer is not timer:
+        timer.include(features.timer)
+
     return {
         "total_score": round(score),
         "breakdown": breakdown,
@@ -33,19 +55,158 @@ def score_resume(resume_data, job_profile, text, file_extension="pdf"):
         "content_score": content_score,
         "formatting_score": formatting_score,
         "alignment_score": alignment_score,
-        "optimization_score": optimization_score
+        "optimization_score": optimization_score,
+        "timings": timer.as_dict()
     }
 
 
+# Function to score one resume against every role and rank the roles by fit
+def rank_roles(resume_data, text, job_profiles, file_extension="pdf", features=None):
+    # Profile-independent work (text scans, grammar check, experience) happens once
+    if features is None:
+        features = ResumeFeatures(resume_data, text, file_extension)
+    ranked = []
+    for category, roles in job_profiles.items():
+        for role, job_profile in roles.items():
+            score_data = score_resume(resume_data, job_profile, text, file_extension, features=features)
+            ranked.append({
+                "category": category,
+                "role": role,
+                "total_score": score_data["total_score"],
+                "content_score": score_data["content_score"],
+                "formatting_score": score_data["formatting_score"],
+                "optimization_score": score_data["optimization_score"],
+                "alignment_score": score_data["alignment_score"],
+                "breakdown": score_data["breakdown"],
+            })
+    ranked.sort(key=lambda entry: entry["total_score"], reverse=True)
+    return ranked
+
+
+class ResumeFeatures:
+    """
+    Everything the scorers derive from a resume that does not depend on the
+    job profile. Each feature is computed on first use and then reused, so one
+    instance can score a resume against many profiles.
+    """
+
+    # The features the scorers read, besides the terms found by the profile matcher
+    SUMMARY_FIELDS = (
+        "text_length", "qualifications_found", "action_verb_lines", "formatting", "grammar_errors", "word_count",
+        "ats_friendly", "experience_years", "relevant_roles", "impact_lines", "side_projects", "online_presence",
+        "certifications", "multi_role_match",
+    )
+
+    def __init__(self, resume_data, text, file_extension="pdf", timer=None):
+        self.resume_data = resume_data
+        self.text = text
+        self.file_extension = file_extension
+        self.timer = timer if timer is not None else StageTimer()
+        self.doc = ResumeDocument(text)
+        self._found = {}
+
+    def summary(self, matcher):
+        """
+        The computed features as plain values, a few KB: enough to score the
+        resume against any profile compiled with matcher, without its text.
+        """
+        summary = {name: getattr(self, name) for name in self.SUMMARY_FIELDS}
+        summary["found_terms"] = {source: self.found_terms(matcher, source) for source in ("text", "content")}
+        return summary
+
+    @classmethod
+    def from_summary(cls, resume_data, summary, matcher, file_extension="pdf"):
+        """Features restored from summary(matcher); nothing is recomputed."""
+        features = cls(resume_data, "", file_extension)
+        for name in cls.SUMMARY_FIELDS:
+            setattr(features, name, summary[name])  # takes the place of the cached_property
+        for source, found in summary["found_terms"].items():
+            features._found[(id(matcher), source)] = (matcher, found)
+        return features
+
+    def found_terms(self, matcher, source="text"):
+        """Lowercased matcher terms found in the resume text or, with source="content", in the parsed fields."""
+        key = (id(matcher), source)
+        if key not in self._found:
+            text = self.content_text if source == "content" else self.text
+            self._found[key] = (matcher, matcher.findall(text))  # keep matcher alive so its id stays unique
+        return self._found[key][1]
+
+    @cached_property
+    def text_length(self):
+        return len(self.text)
+
+    @cached_property
+    def content_text(self):
+        return "\n".join(sum(self.resume_data.values(), [])) # join all values of resume_data into a single string
+
+    @cached_property
+    def content_doc(self):
+        doc = ResumeDocument(self.content_text)
+        doc.reuse_line_tags(self.doc)  # the parsed fields are mostly lines of the text
+        return doc
+
+    @cached_property
+    def qualifications_found(self):
+        return bool(
+            re.search(r"\d+%|\d+\s?(k|K|million|crore|billion|lacks|thosands)|\$\d+|\d+\+\s?(users|clients|projects|leads|deals|campaigns|customers|downloads)", self.content_text)
+            or self.content_doc.has_tag("achievement")
+        )
+
+    @cached_property
+    def action_verb_lines(self):
+        return self.content_doc.tagged_lines("action_verb")
+
+    @cached_property
+    def formatting(self):
+        return score_formatting(self.text, self.resume_data, self.file_extension, self.doc)
+
+    @cached_property
+    def grammar_errors(self):
+        with self.timer.stage("grammar_check"):
+            return grammar_check(self.text)
+
+    @cached_property
+    def word_count(self):
+        return self.doc.word_count
+
+    @cached_property
+    def ats_friendly(self):
+        return not re.search(r'<table|<td|<tr', self.doc.lower)
+
+    @cached_property
+    def experience_years(self):
+        return experience_years(self.text)
+
+    @cached_property
+    def relevant_roles(self):
+        return self.doc.tagged_lines("job_title")
+
+    @cached_property
+    def impact_lines(self):
+        return self.doc.tagged_lines("impact")
+
+    @cached_property
+    def side_projects(self):
+        return self.doc.has_tag("side_project")
+
+    @cached_property
+    def online_presence(self):
+        # Emails and certifications are parsed out of the text, so the text covers them too
+        return self.doc.has_tag("online_presence")
+
+    @cached_property
+    def certifications(self):
+        return self.doc.has_tag("certification")
+
+    @cached_property
+    def multi_role_match(self):
+        all_text = self.doc.lower
+        return sum(all_text.count(role) for role in ["analyst", "developer", "engineer", "researcher"]) >= 2
 
 
-action_verbs = {
-    "led", "developed", "implemented", "created", "designed",
-    "managed", "built", "optimized", "launched", "streamlined",
-    "executed", "increased", "reduced", "automated", "delivered"
-}   
 # function to score content
-def score_content(resume_data, job_profile):
+def score_content(resume_data, job_profile, features=None):
     content_score = 0
     content_breakdown = {
         "required_matched": [],
@@ -56,45 +217,34 @@ def score_content(resume_data, job_profile):
         "keywords_matches": []
     }
     
-    text = "\n".join(sum(resume_data.values(), [])) # join all values of resume_data into a single string
+    if features is None:
+        features = ResumeFeatures(resume_data, "")
+    job_profile = compile_job_profile(job_profile)
+    found = features.found_terms(job_profile.matcher, "content") # every profile term in the text, in one scan
     
     # Required Skills Matching
-    required = job_profile.get("required_skills", [])
-    required_matches = [skill for skill in required if skill.lower() in text.lower()]
+    required_matches = job_profile.match("required_skills", found)
     content_breakdown["required_matched"] = required_matches
-    content_breakdown["missing_required"] = [skill for skill in required if skill.lower() not in text.lower()]
+    content_breakdown["missing_required"] = [skill for skill in job_profile.get("required_skills", []) if skill not in required_matches]
     content_score += min(len(required_matches) * 2, 10)
     
     # Preferred skill matching
-    preferred = job_profile.get("preferred_skills", [])
-    preferred_matches = [skill for skill in preferred if skill.lower() in text.lower()]
+    preferred_matches = job_profile.match("preferred_skills", found)
     content_breakdown["preferred_matched"] = preferred_matches
     content_score += min(len(preferred_matches), 5)
     
     # qualifications achievements 
-    achievement_verbs = [
-    "accelerated", "boosted", "cut", "drove", "enhanced", "exceeded", "generated",
-    "optimized", "streamlined", "transformed", "led", "initiated", "launched",
-    "executed", "revamped", "overhauled", "achieved", "surpassed", "secured",
-    "managed", "mentored", "solved", "won", "closed", "built", "automated"
-    ]
-    recognitions = ["awarded", "recognized", "certified", "nominated", "winner", "top performer", 
-                    "appreciated", "honored", "commendation", "employee of the month", "ranked"]
-
-    if re.search(r"\d+%|\d+\s?(k|K|million|crore|billion|lacks|thosands)|\$\d+|\d+\+\s?(users|clients|projects|leads|deals|campaigns|customers|downloads)", text)\
-        or any (v in text.lower() for v in achievement_verbs) or any(r in text.lower() for r in recognitions):
+    if features.qualifications_found:
             content_breakdown["qualifications_found"] = True
             content_score += 10
             
     # Action Verbs 
-    lines = text.split("\n")
-    action_lines = [line for line in lines if any(v in line.lower() for v in action_verbs)]
-    content_breakdown["action_verb_lines"] = action_lines
+    action_lines = features.action_verb_lines
+    content_breakdown["action_verb_lines"] = list(action_lines)
     content_score += min(len(action_lines), 5)
     
     # Keywords Matching
-    keywords = job_profile.get("keywords", [])
-    keywords_matches = [keyword for keyword in keywords if keyword.lower() in text.lower()]
+    keywords_matches = job_profile.match("keywords", found)
     content_breakdown["keywords_matches"] = keywords_matches
     content_score += min(len(keywords_matches), 10)
     
@@ -102,7 +252,9 @@ def score_content(resume_data, job_profile):
     
     
 # Function to score formatting
-def score_formatting(text, resume_data, file_extension="pdf"):
+def score_formatting(text, resume_data, file_extension="pdf", doc=None):
+    if doc is None:
+        doc = ResumeDocument(text)
     formatting_score = 0
     formatting_breakdown = {
         "section_presence": False,
@@ -116,7 +268,7 @@ def score_formatting(text, resume_data, file_extension="pdf"):
     }
     # section presence
     headers = ["Education", "Experience", "Skills", "Projects", "Achievements", "Certifications"]
-    matches = [header.lower() in text.lower() for header in headers]
+    matches = [header.lower() in doc.lower for header in headers]
     if len(matches) >= 3:
         formatting_breakdown["section_presence"] = True
         formatting_score += 5
@@ -145,7 +297,7 @@ def score_formatting(text, resume_data, file_extension="pdf"):
     
 
     # whitespace and spacing
-    lines = [line.strip() for line in text.split("\n") if line.strip() != ""]
+    lines = doc.nonempty_lines
     line_lengths = [len(line) for line in lines]
 
     # Check that the resume is broken into many well-spaced lines
@@ -158,11 +310,10 @@ def score_formatting(text, resume_data, file_extension="pdf"):
 
     
     # header clarity
-    section_lines = text.split("\n")
     target_headers = [h.lower() for h in headers]
     clear_headers = [
-        line for line in section_lines
-        if any(h in line.strip().lower() for h in target_headers)
+        line for line in doc.lower_lines
+        if any(h in line for h in target_headers)
     ]
 
     if len(clear_headers) >= 3:
@@ -176,24 +327,17 @@ def score_formatting(text, resume_data, file_extension="pdf"):
         
     return formatting_score, formatting_breakdown
     
-import requests
-
-def grammar_check(text):
-    url = "https://api.languagetool.org/v2/check"
-    data = {
-        'text': text[:2000],  # limit text length
-        'language': 'en-US'
-    }
+def grammar_check(text, backend=GRAMMAR_BACKEND):
     try:
-        response = requests.post(url, data=data)
-        result = response.json()
-        matches = result.get("matches", [])
-        return len(matches)
+        checker = get_grammar_checker(backend)
+        return checker(text)
     except Exception as e:
-        print("Grammar API failed:", e)
+        print("Grammar check failed:", e)
         return None
 
-def score_optimization(text, job_profile):
+def score_optimization(text, job_profile, features=None):
+    if features is None:
+        features = ResumeFeatures({}, text)
     
     optimization_score = 0
     optimization_breakdown = {
@@ -204,21 +348,22 @@ def score_optimization(text, job_profile):
     }
     
     # tailoring
-    keywords = job_profile.get("job_specific_keywords", [])
-    matched_keywords = [kw for kw in keywords if kw.lower() in text.lower()]
+    job_profile = compile_job_profile(job_profile)
+    matched_keywords = job_profile.match("job_specific_keywords", features.found_terms(job_profile.matcher))
     optimization_breakdown["tailoring"] = matched_keywords
     optimization_score += 4
     
     
     # Spelling/Grammar Check
-    errors = grammar_check(text)
+    errors = features.grammar_errors
     if errors is not None:
         optimization_breakdown["spelling_grammar_issues"] = errors
-        if errors <= 2:
+        errors_per_page = errors * GRAMMAR_PAGE_CHARS / max(features.text_length, GRAMMAR_PAGE_CHARS)
+        if errors_per_page <= 2:
             optimization_score += 5
-        elif errors <= 5:
+        elif errors_per_page <= 5:
             optimization_score += 3
-        elif errors <= 10:
+        elif errors_per_page <= 10:
             optimization_score += 1
     else:
         optimization_breakdown["spelling_grammar_issues"] = "API failed"
@@ -227,7 +372,7 @@ def score_optimization(text, job_profile):
 
     
     # concise
-    word_count = len(text.split())
+    word_count = features.word_count
     if word_count <= 800:
         optimization_breakdown["concise"] = True
         optimization_score += 5
@@ -237,15 +382,16 @@ def score_optimization(text, job_profile):
         optimization_score += 1
         
     # ats friendly
-    if not re.search(r'<table|<td|<tr', text, re.IGNORECASE):
+    if features.ats_friendly:
         optimization_breakdown["ats_friendly"] = True
         optimization_score += 4
         
     return optimization_score, optimization_breakdown
 
 
-def score_alignment(text, resume_data, job_profile):
-    from difflib import SequenceMatcher
+def score_alignment(text, resume_data, job_profile, features=None):
+    if features is None:
+        features = ResumeFeatures(resume_data, text)
 
     alignment_score = 0
     alignment_breakdown = {
@@ -259,32 +405,7 @@ def score_alignment(text, resume_data, job_profile):
     }
     
     # experience alignment
-    date_range_pattern = re.findall(
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*(?:–|-|to)\s*(?:Present|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-        text,
-        re.IGNORECASE
-    )
-
-    total_months = 0
-    for match in re.finditer(
-        r"((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})\s*(–|-|to)\s*((Present)|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-        text,
-        re.IGNORECASE,
-    ):
-        try:
-            start_str = match.group(1)
-            end_str = match.group(4)
-
-            start = dateutil.parser.parse(start_str)
-            end = dateutil.parser.parse("today") if "present" in end_str.lower() else dateutil.parser.parse(end_str)
-
-            delta = relativedelta(end, start)
-            total_months += delta.years * 12 + delta.months
-        except:
-            continue
-
-    # Convert months to years
-    total_years = round(total_months / 12, 1)
+    total_years = features.experience_years
     min_exp = job_profile.get("min_experience", 0)
 
     if total_years >= min_exp:
@@ -297,41 +418,32 @@ def score_alignment(text, resume_data, job_profile):
         alignment_score += 6
         
     # relevant roles
-    job_titles = ["developer", "engineer", "analyst", "researcher", "consultant", "manager"]
-    matched_roles = [line for line in text.split("\n") if any(title in line.lower() for title in job_titles)]
-    alignment_breakdown["relevant_roles"] = matched_roles
+    matched_roles = features.relevant_roles
+    alignment_breakdown["relevant_roles"] = list(matched_roles)
     alignment_score += min(len(matched_roles), 2) * 2
     
     # Project Impact
-    impact_keywords = ["launched", "delivered", "increased", "optimized", "boosted", "reduced"]
-    impact_lines = [line for line in text.split("\n") if any(k in line.lower() for k in impact_keywords)]
-    alignment_breakdown["project_impact"] = impact_lines
+    impact_lines = features.impact_lines
+    alignment_breakdown["project_impact"] = list(impact_lines)
     alignment_score += min(len(impact_lines), 2) * 2
 
     # Side Projects
-    if any("github" in line.lower() or "open source" in line.lower() for line in text.split("\n")):
+    if features.side_projects:
         alignment_breakdown["side_projects"] = True
         alignment_score += 3
 
     # Online Presence
-    links = resume_data.get("email", []) + resume_data.get("certifications", []) + text.split("\n")
-    if any("linkedin" in line.lower() or "github" in line.lower() or "portfolio" in line.lower() for line in links):
+    if features.online_presence:
         alignment_breakdown["online_presence"] = True
         alignment_score += 2
 
     # Certifications
-    cert_keywords = ["aws", "gcp", "azure", "pmp", "credential", "completed",
-                     "certified", "certification", "badge", "course", 
-                     "completed .* course", "earned .* certificate", "aws certified",
-                     "microsoft certified", "google cloud certified", "scrum master",
-                     "pmp", "six sigma", "cissp", "cka", "ckad", "csm", "ccnp", "ccie"]
-    if any(any(cert in c.lower() for cert in cert_keywords) for c in text.split("\n")):
+    if features.certifications:
         alignment_breakdown["certifications"] = True
         alignment_score += 2
 
     # Multi-role match
-    all_text = text.lower()
-    if sum(all_text.count(role.lower()) for role in ["analyst", "developer", "engineer", "researcher"]) >= 2:
+    if features.multi_role_match:
         alignment_breakdown["multi_role_match"] = 1
         alignment_score += 1
         
@@ -0,0 +1,252 @@
+"""
+Long-running HTTP service around the parse and score pipeline.
+
+    python service.py --port 8000 --workers 4
+
+    curl localhost:8000/health
+    curl localhost:8000/roles
+    curl -F file=@resume.pdf "localhost:8000/score?category=Experienced&role=Senior%20Software%20Developer"
+
+Each worker process loads the spaCy model and the job profiles once, at start
+up. At most workers + queue resumes are accepted at a time; further uploads get
+429 Too Many Requests until a slot frees up. Set
+RESUME_PARSER_GRAMMAR_BACKEND=local to run without calling LanguageTool.
+"""
+import argparse
+import json
+import os
+import threading
+import multiprocessing
+from email.parser import BytesParser
+from email.policy import HTTP
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils import load_job_profiles
+from extraction import ExtractionError
+
+SERVICE_WORKERS = int(os.environ.get("RESUME_PARSER_SERVICE_WORKERS", os.cpu_count() or 1))
+# Uploads allowed to wait for a free worker before new ones are turned away
+SERVICE_QUEUE = int(os.environ.get("RESUME_PARSER_SERVICE_QUEUE", SERVICE_WORKERS * 2))
+SERVICE_TIMEOUT = float(os.environ.get("RESUME_PARSER_SERVICE_TIMEOUT", 60))
+MAX_UPLOAD_BYTES = int(os.environ.get("RESUME_PARSER_MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+
+_job_profiles = None  # loaded once per worker process
+
+
+def _init_worker(profiles_path):
+    global _job_profiles
+    # Importing batch loads the spaCy model; together with the compiled profiles
+    # that is paid once per worker instead of once per request
+    import batch  # noqa: F401
+    import extraction
+
+    # Each request already has a worker process; don't split its pages further
+    extraction.PDF_PARALLEL_PAGES = 0
+    _job_profiles = load_job_profiles(profiles_path)
+
+
+def _score(file_name, data, category, role):
+    from batch import evaluate_resume
+    return evaluate_resume(file_name, data, _job_profiles[category][role])
+
+
+def _ready(_):
+    return os.getpid()
+
+
+# Function to pull the uploaded file out of a multipart/form-data body
+def parse_multipart(content_type, body):
+    """Returns ((file_name, file_bytes), fields), taking the first part that has a filename as the file."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    upload, fields = None, {}
+    if not message.is_multipart():
+        return None, fields
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if part.get_filename() and upload is None:
+            upload = (part.get_filename(), part.get_payload(decode=True))
+        elif name:
+            fields[name] = part.get_content()
+    return upload, fields
+
+
+class ScoringService:
+    """The job profiles plus a bounded pool of warm worker processes."""
+
+    def __init__(self, profiles_path="job_profile.json", workers=SERVICE_WORKERS, queue=SERVICE_QUEUE, timeout=SERVICE_TIMEOUT):
+        self.job_profiles = load_job_profiles(profiles_path)
+        self.workers = workers
+        self.capacity = workers + queue
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        # spawn rather than fork: the server is multi-threaded
+        context = multiprocessing.get_context("spawn")
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                        initializer=_init_worker, initargs=(profiles_path,))
+
+    def warm_up(self):
+        """Start every worker now so the first requests don't pay for loading the model."""
+        list(self.pool.map(_ready, range(self.workers)))
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def reserve(self):
+        """Takes a slot for one upload; returns False when the service is saturated."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._lock:
+            self._in_flight += 1
+        return True
+
+    def release(self, _=None):
+        """Gives back a slot taken with reserve()."""
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def submit(self, file_name, data, category, role):
+        """Returns a future for the score; the slot taken with reserve() is released when it finishes."""
+        try:
+            future = self.pool.submit(_score, file_name, data, category, role)
+        except Exception:
+            self.release()
+            raise
+        # The slot is held until the work really finishes, even if the client gave up
+        future.add_done_callback(self.release)
+        return future
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    service = None  # set by make_server
+
+    def _send_json(self, status, payload, headers=()):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "workers": self.service.workers,
+                                  "in_flight": self.service.in_flight, "capacity": self.service.capacity})
+        elif path == "/roles":
+            self._send_json(200, {category: list(roles) for category, roles in self.service.job_profiles.items()})
+        else:
+            self._send_json(404, {"error": f"Not found: {path}"})
+
+    def _read_upload(self, url, length):
+        """Returns ((file_name, data, category, role), None), or (None, error message) for a bad request."""
+        body = self.rfile.read(length)
+
+        # Multipart form uploads, or the raw file as the body with ?filename=
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            upload, fields = parse_multipart(content_type, body)
+            params = {**fields, **params}
+        else:
+            upload = (params.get("filename", "resume"), body) if body else None
+        if upload is None:
+            return None, "No resume uploaded: send a multipart 'file' field"
+
+        category, role = params.get("category"), params.get("role")
+        if role not in self.service.job_profiles.get(category, {}):
+            return None, f"Unknown role '{category}: {role}' (see /roles)"
+        return (*upload, category, role), None
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/score":
+            self._send_json(404, {"error": f"Not found: {url.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Content-Length must be a non-negative integer"})
+            self.close_connection = True  # can't tell where the body ends
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {"error": f"Upload larger than {MAX_UPLOAD_BYTES} bytes"})
+            self.close_connection = True  # the body was not read
+            return
+        # Turn uploads away while saturated before reading them, not after
+        if not self.service.reserve():
+            self._send_json(429, {"error": "Too many resumes in progress, retry shortly"}, [("Retry-After", "1")])
+            self.close_connection = True  # the body was not read
+            return
+        try:
+            request, error = self._read_upload(url, length)
+        except BaseException:
+            self.service.release()
+            raise
+        if error is not None:
+            self.service.release()
+            self._send_json(400, {"error": error})
+            return
+        file_name, data, category, role = request
+        future = self.service.submit(file_name, data, category, role)
+        try:
+            score_data = future.result(timeout=self.service.timeout)
+        except TimeoutError:
+            self._send_json(504, {"error": f"Scoring took longer than {self.service.timeout:g} s"})
+            return
+        except ExtractionError as e:
+            self._send_json(422, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send_json(200, {"file": file_name, "category": category, "role": role, **score_data})
+
+
+# Function to build the HTTP server around a scoring service
+def make_server(service, host="127.0.0.1", port=8000):
+    handler = type("BoundScoringHandler", (ScoringHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve resume scoring over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--profiles", default="job_profile.json", help="job profile JSON file")
+    parser.add_argument("-w", "--workers", type=int, default=SERVICE_WORKERS, help="worker processes")
+    parser.add_argument("--queue", type=int, default=None, help="uploads allowed to wait for a worker (default: 2 per worker)")
+    args = parser.parse_args(argv)
+
+    queue = args.queue if args.queue is not None else args.workers * 2
+    service = ScoringService(args.profiles, args.workers, queue)
+    print(f"Starting {args.workers} workers...")
+    service.warm_up()
+    server = make_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{args.port} (capacity {service.capacity})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
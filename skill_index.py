@@ -0,0 +1,231 @@
+import re
+import threading
+
+OPERATORS = {"and", "or", "not"}
+# Quoted names, parentheses, or runs of anything else; "c++", "node.js" and "ci/cd" stay whole
+_TOKEN = re.compile(r'"([^"]*)"|([()])|([^\s()"]+)')
+# byte value -> positions of its set bits, for turning bitmaps back into slots
+_BYTE_BITS = [[bit for bit in range(8) if value >> bit & 1] for value in range(256)]
+
+
+# Function to put a skill name in the form the index and the candidate store key on
+def canonical_skill(skill):
+    return " ".join(skill.lower().split())
+
+
+# Function to split a skill query into operators, parentheses and skill names
+def tokenize(query):
+    """
+    Bare words between operators make up one skill name, so
+    "machine learning AND aws" is two skills. Quote a name that is also an
+    operator, e.g. "\"or\"".
+    """
+    tokens, words = [], []
+    for quoted, paren, word in _TOKEN.findall(query):
+        if word and word.lower() not in OPERATORS:
+            words.append(word)
+            continue
+        if words:
+            tokens.append(("skill", canonical_skill(" ".join(words))))
+            words = []
+        if quoted:
+            tokens.append(("skill", canonical_skill(quoted)))
+        elif paren:
+            tokens.append((paren, paren))
+        else:
+            tokens.append((word.lower(), word.lower()))
+    if words:
+        tokens.append(("skill", canonical_skill(" ".join(words))))
+    return tokens
+
+
+class _Parser:
+    # expression := term ("or" term)* ; term := factor ("and" factor)* ; factor := "not" factor | "(" expression ")" | skill
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self, kind):
+        if self.peek() != kind:
+            found = self.tokens[self.position][1] if self.position < len(self.tokens) else "end of query"
+            raise ValueError(f"Expected {kind} but found '{found}'")
+        self.position += 1
+        return self.tokens[self.position - 1][1]
+
+    def expression(self):
+        node = self.term()
+        while self.peek() == "or":
+            self.take("or")
+            node = ("or", node, self.term())
+        return node
+
+    def term(self):
+        node = self.factor()
+        while self.peek() == "and":
+            self.take("and")
+            node = ("and", node, self.factor())
+        return node
+
+    def factor(self):
+        if self.peek() == "not":
+            self.take("not")
+            return ("not", self.factor())
+        if self.peek() == "(":
+            self.take("(")
+            node = self.expression()
+            self.take(")")
+            return node
+        return ("skill", self.take("skill"))
+
+
+# Function to parse a boolean skill query such as "python AND (aws OR gcp) AND NOT azure"
+def parse_query(query):
+    """Returns a tree of ("and"|"or", left, right), ("not", node) and ("skill", name); raises ValueError on bad syntax."""
+    parser = _Parser(tokenize(query))
+    if parser.peek() is None:
+        raise ValueError("Empty skill query")
+    node = parser.expression()
+    if parser.peek() is not None:
+        raise ValueError(f"Unexpected '{parser.tokens[parser.position][1]}' in skill query")
+    return node
+
+
+class SkillIndex:
+    """
+    Canonical skill -> posting list of candidates, each list a bitmap held in
+    a Python int (bit n set when the candidate in slot n has the skill), so
+    AND, OR and NOT are single integer operations however many candidates
+    there are. Candidates can be added, updated and removed one at a time;
+    a removed candidate's slot is reused by the next one added.
+    """
+
+    def __init__(self):
+        self._postings = {}  # skill -> bitmap
+        self._slots = {}  # candidate id -> slot
+        self._ids = []  # slot -> candidate id, None when free
+        self._skills = []  # slot -> that candidate's skills, to clear them on update
+        self._free = []
+        self._live = 0  # bitmap of slots in use, the universe NOT works within
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_skill_lists(cls, skill_lists):
+        """Builds an index from (candidate id, skills) pairs; a repeated id keeps its last skills."""
+        index = cls()
+        members = {}  # skill -> slots
+        for candidate_id, skills in dict(skill_lists).items():
+            slot = len(index._ids)
+            skills = frozenset(canonical_skill(skill) for skill in skills if skill.strip())
+            index._slots[candidate_id] = slot
+            index._ids.append(candidate_id)
+            index._skills.append(skills)
+            for skill in skills:
+                members.setdefault(skill, []).append(slot)
+        # Set each posting's bits in a byte array and convert once, rather than
+        # growing a big int one OR at a time
+        size = (len(index._ids) + 7) // 8
+        for skill, slots in members.items():
+            bits = bytearray(size)
+            for slot in slots:
+                bits[slot >> 3] |= 1 << (slot & 7)
+            index._postings[skill] = int.from_bytes(bits, "little")
+        index._live = (1 << len(index._ids)) - 1
+        return index
+
+    def add(self, candidate_id, skills):
+        """Indexes a candidate's skills, replacing any it was indexed with before."""
+        skills = {canonical_skill(skill) for skill in skills if skill.strip()}
+        with self._lock:
+            slot = self._slots.get(candidate_id)
+            if slot is None:
+                if self._free:
+                    slot = self._free.pop()
+                    self._ids[slot] = candidate_id
+                else:
+                    slot = len(self._ids)
+                    self._ids.append(candidate_id)
+                    self._skills.append(frozenset())
+                self._slots[candidate_id] = slot
+                self._live |= 1 << slot
+            bit = 1 << slot
+            old = self._skills[slot]
+            for skill in old - skills:
+                self._clear(skill, bit)
+            for skill in skills - old:
+                self._postings[skill] = self._postings.get(skill, 0) | bit
+            self._skills[slot] = frozenset(skills)
+
+    def remove(self, candidate_id):
+        with self._lock:
+            slot = self._slots.pop(candidate_id, None)
+            if slot is None:
+                return
+            bit = 1 << slot
+            for skill in self._skills[slot]:
+                self._clear(skill, bit)
+            self._skills[slot] = frozenset()
+            self._ids[slot] = None
+            self._live &= ~bit
+            self._free.append(slot)
+
+    def _clear(self, skill, bit):
+        remaining = self._postings[skill] & ~bit
+        if remaining:
+            self._postings[skill] = remaining
+        else:
+            del self._postings[skill]
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, candidate_id):
+        return candidate_id in self._slots
+
+    def skills(self):
+        """(skill, candidates) pairs, most common first."""
+        counts = [(skill, bin(bitmap).count("1")) for skill, bitmap in self._postings.items()]
+        return sorted(counts, key=lambda item: (-item[1], item[0]))
+
+    def _evaluate(self, node):
+        kind = node[0]
+        if kind == "skill":
+            return self._postings.get(node[1], 0)
+        if kind == "not":
+            return self._live & ~self._evaluate(node[1])
+        left, right = self._evaluate(node[1]), self._evaluate(node[2])
+        return left & right if kind == "and" else left | right
+
+    def bitmap(self, query):
+        """The bitmap of candidates matching query, a string or a parse_query tree."""
+        node = parse_query(query) if isinstance(query, str) else query
+        with self._lock:
+            return self._evaluate(node)
+
+    def count(self, query):
+        return bin(self.bitmap(query)).count("1")
+
+    def _slot_ids(self, bitmap):
+        # A byte at a time, skipping empty bytes: much faster than peeling off one bit at a time
+        data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        return [self._ids[(position << 3) + bit] for position, value in enumerate(data) if value for bit in _BYTE_BITS[value]]
+
+    def search(self, query):
+        """Ids of the candidates matching query, in slot order."""
+        bitmap = self.bitmap(query)
+        with self._lock:
+            return self._slot_ids(bitmap)
+
+    def matches(self, query):
+        """
+        (ids, None) with the ids matching query or, when most candidates match,
+        (None, ids) with those that don't; whichever list is shorter to hand
+        on, e.g. to CandidateStore.search.
+        """
+        bitmap = self.bitmap(query)
+        with self._lock:
+            if bin(bitmap).count("1") <= len(self._slots) // 2:
+                return self._slot_ids(bitmap), None
+            return None, self._slot_ids(self._live & ~bitmap)
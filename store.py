@@ -0,0 +1,318 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import date
+
+from experience import experience_span
+from skill_index import canonical_skill
+
+STORE_PATH = os.environ.get(
+    "RESUME_PARSER_STORE_PATH",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "resume-parser", "candidates.db"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    file_hash TEXT NOT NULL UNIQUE,
+    file_name TEXT NOT NULL,
+    name TEXT,
+    email TEXT,
+    experience_years REAL NOT NULL DEFAULT 0,
+    -- experience_span of the text: settled months, and the month index (year * 12 +
+    -- month - 1) a period running to "Present" began; experience_years is
+    -- brought up to date from them as the months pass (see refresh_experience)
+    experience_months INTEGER NOT NULL DEFAULT 0,
+    experience_since INTEGER,
+    experience_as_of INTEGER NOT NULL DEFAULT 0,
+    text TEXT NOT NULL,
+    entities TEXT NOT NULL,
+    added_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_experience ON candidates (experience_years);
+-- Candidates whose experience_years grows each month
+CREATE INDEX IF NOT EXISTS candidates_ongoing ON candidates (experience_as_of) WHERE experience_since IS NOT NULL;
+
+-- One row per (skill, candidate): a skill lookup is a range scan of the primary key
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    skill TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    PRIMARY KEY (skill, candidate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS candidate_skills_candidate ON candidate_skills (candidate_id);
+
+CREATE TABLE IF NOT EXISTS scores (
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    role TEXT NOT NULL,
+    score REAL NOT NULL,
+    result TEXT NOT NULL,
+    scored_at REAL NOT NULL,
+    PRIMARY KEY (candidate_id, category, role)
+);
+CREATE INDEX IF NOT EXISTS scores_role ON scores (category, role, score);
+
+-- Full-text index over the cleaned text, kept in step with candidates by the triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS candidates_fts USING fts5 (
+    text, content='candidates', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS candidates_fts_insert AFTER INSERT ON candidates BEGIN
+    INSERT INTO candidates_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS candidates_fts_delete AFTER DELETE ON candidates BEGIN
+    INSERT INTO candidates_fts (candidates_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS candidates_fts_update AFTER UPDATE OF text ON candidates BEGIN
+    INSERT INTO candidates_fts (candidates_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO candidates_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+SUMMARY_COLUMNS = "c.id, c.file_hash, c.file_name, c.name, c.email, c.experience_years"
+
+
+# Function to get the month index experience is worked out in
+def current_month(today=None):
+    today = today or date.today()
+    return today.year * 12 + today.month - 1
+
+
+# Function to get the years of experience as of a month, from experience_span's parts
+def years_as_of(months, since, month):
+    """The same figure experience_years gives for the text in that month."""
+    if since is not None:
+        months += month - since
+    return round(months / 12, 1)
+
+
+# Function to turn free text into an FTS5 query that matches all of its words
+def fts_query(text):
+    """Each word is quoted, so punctuation or FTS operators typed by a user can't break the query."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+class CandidateStore:
+    """
+    Parsed resumes and their per-role scores in a local SQLite database, with
+    an FTS5 index over the text and a skill index. Candidates are keyed by the
+    hash of the uploaded file, so adding the same resume again updates it.
+    One connection is shared between threads behind a lock.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")  # readers don't wait for a bulk insert
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(candidates)")}
+            migrate = columns and "experience_since" not in columns
+            if migrate:
+                for column in ("experience_months INTEGER NOT NULL DEFAULT 0", "experience_since INTEGER",
+                               "experience_as_of INTEGER NOT NULL DEFAULT 0"):
+                    self._conn.execute(f"ALTER TABLE candidates ADD COLUMN {column}")
+            self._conn.executescript(SCHEMA)
+        if migrate:
+            # A store from before experience was kept current: work it out once from the text
+            self._migrate_experience()
+
+    def add_candidates(self, candidates):
+        """
+        candidates is an iterable of (file_hash, file_name, cleaned_text, entities),
+        entities being the extract_entities output. All are written in one
+        transaction. Returns the number added or updated.
+        """
+        now = time.time()
+        month = current_month()
+        count = 0
+        with self._lock, self._conn:
+            for file_hash, file_name, text, entities in candidates:
+                name = entities.get("name") or [None]
+                email = entities.get("email") or [None]
+                months, since = experience_span(text)
+                years = years_as_of(months, since, month)
+                candidate_id = self._conn.execute(
+                    "INSERT INTO candidates (file_hash, file_name, name, email, experience_years, experience_months, "
+                    "experience_since, experience_as_of, text, entities, added_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (file_hash) DO UPDATE SET file_name = excluded.file_name, name = excluded.name, "
+                    "email = excluded.email, experience_years = excluded.experience_years, "
+                    "experience_months = excluded.experience_months, experience_since = excluded.experience_since, "
+                    "experience_as_of = excluded.experience_as_of, text = excluded.text, entities = excluded.entities "
+                    "RETURNING id",
+                    (file_hash, file_name, name[0], email[0], years, months, since, month, text, json.dumps(entities), now),
+                ).fetchone()[0]
+                self._conn.execute("DELETE FROM candidate_skills WHERE candidate_id = ?", (candidate_id,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO candidate_skills (skill, candidate_id) VALUES (?, ?)",
+                    [(canonical_skill(skill), candidate_id) for skill in entities.get("skills", []) if skill.strip()],
+                )
+                count += 1
+        return count
+
+    def refresh_experience(self, today=None):
+        """
+        Brings experience_years up to date for candidates with a period running
+        to "Present", once per month and without reading their text again.
+        Returns the number updated.
+        """
+        month = current_month(today)
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, experience_months, experience_since FROM candidates "
+                "WHERE experience_since IS NOT NULL AND experience_as_of < ?", (month,)
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE candidates SET experience_years = ?, experience_as_of = ? WHERE id = ?",
+                [(years_as_of(months, since, month), month, candidate_id) for candidate_id, months, since in rows],
+            )
+        return len(rows)
+
+    def _migrate_experience(self):
+        month = current_month()
+        with self._lock, self._conn:
+            rows = self._conn.execute("SELECT id, text FROM candidates").fetchall()
+            updates = []
+            for candidate_id, text in rows:
+                months, since = experience_span(text)
+                updates.append((years_as_of(months, since, month), months, since, month, candidate_id))
+            self._conn.executemany(
+                "UPDATE candidates SET experience_years = ?, experience_months = ?, experience_since = ?, "
+                "experience_as_of = ? WHERE id = ?",
+                updates,
+            )
+
+    def add_scores(self, scores):
+        """
+        scores is an iterable of (file_hash, category, role, score_data) for
+        candidates already in the store, written in one transaction; scores
+        for unknown hashes are skipped. Returns the number written.
+        """
+        now = time.time()
+        rows = [(category, role, score_data["total_score"], json.dumps(score_data), now, file_hash)
+                for file_hash, category, role, score_data in scores]
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "INSERT INTO scores (candidate_id, category, role, score, result, scored_at) "
+                "SELECT id, ?, ?, ?, ?, ? FROM candidates WHERE file_hash = ? "
+                "ON CONFLICT (candidate_id, category, role) DO UPDATE SET "
+                "score = excluded.score, result = excluded.result, scored_at = excluded.scored_at",
+                rows,
+            )
+            return cursor.rowcount
+
+    def known_hashes(self, file_hashes):
+        """The subset of file_hashes already in the store."""
+        file_hashes = list(file_hashes)
+        known = set()
+        with self._lock:
+            for start in range(0, len(file_hashes), 500):  # stay under SQLite's bound-parameter limit
+                chunk = file_hashes[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT file_hash FROM candidates WHERE file_hash IN ({','.join('?' * len(chunk))})", chunk
+                )
+                known.update(row[0] for row in rows)
+        return known
+
+    def get(self, file_hash):
+        """The stored candidate with its text, entities and every role it was scored for, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM candidates WHERE file_hash = ?", (file_hash,)).fetchone()
+            if row is None:
+                return None
+            scores = self._conn.execute(
+                "SELECT category, role, result FROM scores WHERE candidate_id = ?", (row["id"],)
+            ).fetchall()
+        candidate = dict(row)
+        candidate["entities"] = json.loads(candidate["entities"])
+        candidate["scores"] = {(category, role): json.loads(result) for category, role, result in scores}
+        return candidate
+
+    def search(self, skills=(), min_years=None, text=None, category=None, role=None, min_score=None, limit=50,
+               ids=None, exclude_ids=None, unscored_for=None):
+        """
+        Candidates with every one of skills, at least min_years of experience
+        and all the words of text; if given, with one of ids and none of
+        exclude_ids (see SkillIndex.matches), and not yet scored for the
+        (category, role) pair unscored_for. With category and role, only
+        candidates scored for that role are returned, best first, each with
+        its "score"; otherwise the most experienced come first. At most limit
+        are returned, all of them when limit is None.
+        """
+        self.refresh_experience()
+        query = f"SELECT {SUMMARY_COLUMNS}"
+        joins, conditions, params = [], [], []
+        if role is not None:
+            query += ", s.score"
+            joins.append("JOIN scores s ON s.candidate_id = c.id AND s.category = ? AND s.role = ?")
+            params += [category, role]
+        for skill in skills:
+            conditions.append("c.id IN (SELECT candidate_id FROM candidate_skills WHERE skill = ?)")
+            params.append(canonical_skill(skill))
+        if ids is not None:
+            # One JSON parameter however many ids there are
+            conditions.append("c.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(ids)))
+        if exclude_ids:
+            conditions.append("c.id NOT IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(exclude_ids)))
+        if unscored_for is not None:
+            conditions.append("c.id NOT IN (SELECT candidate_id FROM scores WHERE category = ? AND role = ?)")
+            params += list(unscored_for)
+        if min_years is not None:
+            conditions.append("c.experience_years >= ?")
+            params.append(min_years)
+        if text and text.strip():
+            conditions.append("c.id IN (SELECT rowid FROM candidates_fts WHERE candidates_fts MATCH ?)")
+            params.append(fts_query(text))
+        if min_score is not None and role is not None:
+            conditions.append("s.score >= ?")
+            params.append(min_score)
+
+        query += " FROM candidates c " + " ".join(joins)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY " + ("s.score DESC" if role is not None else "c.experience_years DESC") + ", c.id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+    def skill_lists(self, file_hashes=None):
+        """(candidate id, skills) for the given candidates, or for all of them, to feed a SkillIndex."""
+        query = "SELECT c.id, s.skill FROM candidates c LEFT JOIN candidate_skills s ON s.candidate_id = c.id"
+        params = []
+        if file_hashes is not None:
+            query += " WHERE c.file_hash IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(file_hashes)))
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY c.id", params).fetchall()
+        skill_lists = {}
+        for candidate_id, skill in rows:
+            skills = skill_lists.setdefault(candidate_id, [])
+            if skill is not None:  # a candidate without skills still belongs in the index
+                skills.append(skill)
+        return list(skill_lists.items())
+
+    def skill_counts(self, limit=50):
+        """(skill, candidates) pairs, most common first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT skill, COUNT(*) AS candidates FROM candidate_skills GROUP BY skill ORDER BY candidates DESC, skill LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
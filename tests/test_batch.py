@@ -0,0 +1,82 @@
+import os
+
+from benchmarks.pdf_writer import write_pdf
+from batch import iter_evaluate, parse_resumes
+from cache import DiskCache
+from extraction import ExtractionError
+
+
+def cached_files(cache):
+    return [name for _, _, names in os.walk(cache.directory) for name in names]
+
+
+def test_failed_and_empty_extractions_are_reported_and_not_cached(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    files = [("blank.pdf", write_pdf([[]])), ("notes.txt", b"plain text"), ("ok.pdf", write_pdf([["Jane Doe", "Python"]]))]
+
+    blank, unsupported, ok = parse_resumes(files, cache=cache)
+
+    assert isinstance(blank, ExtractionError) and "No text" in str(blank)
+    assert isinstance(unsupported, ExtractionError)
+    assert "Jane Doe" in ok[0]
+    assert len(cached_files(cache)) == 1  # only the resume that parsed
+
+
+def test_parsed_resumes_are_only_scored():
+    text = "Jane Doe\nSoftware Engineer, Acme Corp  Jan 2020 - Jan 2023\nPython, AWS"
+    files = [("jane.pdf", (text, {"name": ["Jane Doe"], "skills": ["Python", "AWS"]}))]
+    [(index, name, score_data, error)] = iter_evaluate(files, {"required_skills": ["Python"]}, max_workers=1, parsed=True)
+    assert (index, name, error) == (0, "jane.pdf", None)
+    assert score_data["breakdown"]["content"]["required_matched"] == ["Python"]
+
+
+def test_summaries_score_like_the_text():
+    from scoring import ResumeFeatures, score_resume
+    from utils import compile_job_profile
+
+    text = "Jane Doe\nSoftware Engineer, Acme Corp  Jan 2020 - Jan 2023\nPython, AWS, Docker"
+    parsed = {"name": ["Jane Doe"], "skills": ["Python", "AWS", "Docker"]}
+    profile = compile_job_profile({"required_skills": ["Python", "Docker"], "min_experience": 2})
+    [(_, _, score_data, error)] = iter_evaluate([("jane.pdf", (text, parsed))], profile, max_workers=1, parsed=True, summarise=True)
+    assert error is None
+    features = ResumeFeatures.from_summary(parsed, score_data.pop("features"), profile.matcher)
+    rescored = score_resume(parsed, profile, "", features=features)
+    assert rescored["total_score"] == score_data["total_score"]
+    assert rescored["breakdown"] == score_data["breakdown"]
+
+
+def test_closing_the_generator_early_does_not_wait_for_the_batch(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import batch
+
+    def slow_chunk(chunk, job_profile, parsed):
+        time.sleep(0.1)
+        return [(index, {"total_score": 1}, None) for index, _, _ in chunk]
+
+    # Threads stand in for the worker processes, so the patched chunk function is used
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", lambda max_workers, **_: ThreadPoolExecutor(max_workers))
+    monkeypatch.setattr(batch, "_evaluate_chunk", slow_chunk)
+    results = batch.iter_evaluate([(f"{index}.pdf", b"") for index in range(100)], {}, max_workers=2, chunk_size=1)
+    next(results)
+    start = time.perf_counter()
+    results.close()
+    assert time.perf_counter() - start < 1  # the whole batch would take about 5 s
+
+
+def test_changing_a_parser_setting_misses_the_cache(tmp_path, monkeypatch):
+    import extraction
+    import parser
+
+    cache = DiskCache(str(tmp_path))
+    files = [("ok.pdf", write_pdf([["Jane Doe", "Python"]]))]
+    parse_resumes(files, cache=cache)
+    parse_resumes(files, cache=cache)
+    assert len(cached_files(cache)) == 1
+    for module, setting, value in [(parser, "FULL_DOCUMENT_NER", True), (parser, "PDF_BACKEND", "pdfminer"),
+                                   (parser, "NLP_MODE", "full"), (extraction, "PDF_MAX_PAGES", 1),
+                                   (extraction, "PDF_MAX_CHARS", 100)]:
+        monkeypatch.setattr(module, setting, value)
+        parse_resumes(files, cache=cache)
+    assert len(cached_files(cache)) == 6
@@ -0,0 +1,51 @@
+import os
+import random
+
+from cache import DiskCache, content_key
+
+
+def entry_path(cache, key):
+    return os.path.join(cache.directory, key[:2], key)
+
+
+def payload(seed):
+    # Random digits barely compress, so every entry takes about the same room on disk
+    rng = random.Random(seed)
+    return "".join(rng.choice("0123456789") for _ in range(2000))
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    keys = [content_key(str(index).encode(), "v") for index in range(5)]
+    probe = DiskCache(str(tmp_path / "probe"))
+    probe.set(keys[0], payload(0))
+    size = os.path.getsize(entry_path(probe, keys[0]))
+    # Room for four entries; a fifth goes over, and evicting down to 90% removes two
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=int(size * 4.2))
+    for age, key in enumerate(keys[:4]):
+        cache.set(key, payload(age))
+        os.utime(entry_path(cache, key), (1_000_000 + age, 1_000_000 + age))
+    assert cache.get(keys[0]) is not None  # a read makes the oldest entry the most recently used
+
+    cache.set(keys[4], payload(4))  # over budget: evict down to 90% of it
+    assert [os.path.exists(entry_path(cache, key)) for key in keys] == [True, False, False, True, True]
+
+
+def test_keys_depend_on_content_and_version():
+    assert content_key(b"resume", "7|pdfplumber") == content_key(b"resume", "7|pdfplumber")
+    assert content_key(b"resume", "7|pdfplumber") != content_key(b"resume", "7|pdfminer")
+    assert content_key(b"resume", "7") != content_key(b"resume2", "7")
+
+
+def test_a_zero_budget_turns_the_cache_off(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=0)
+    cache.set("ab" * 32, {"text": "x"})
+    assert cache.get("ab" * 32) is None and os.listdir(tmp_path) == []
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    key = "cd" * 32
+    cache.set(key, {"text": "x"})
+    with open(entry_path(cache, key), "wb") as f:
+        f.write(b"not zlib")
+    assert cache.get(key) is None
@@ -0,0 +1,21 @@
+import sys
+import json
+
+import cli
+
+
+def test_explicit_non_resume_files_get_an_error_record(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "batch", None)  # importing batch (and the spaCy model) would fail
+    notes = tmp_path / "notes.txt"
+    notes.write_text("not a resume")
+    output = tmp_path / "scores.jsonl"
+    status = cli.main([str(notes), "--category", "Experienced", "--role", "Senior Software Developer", "-o", str(output)])
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert status == 1
+    assert records == [{"file": str(notes), "error": "Unsupported file format, must be a .pdf or .docx"}]
+
+
+def test_directories_contribute_only_resumes(tmp_path):
+    for name in ("a.pdf", "b.DOCX", "notes.txt"):
+        (tmp_path / name).write_text("")
+    assert cli.collect_files([str(tmp_path)]) == [str(tmp_path / "a.pdf"), str(tmp_path / "b.DOCX")]
@@ -0,0 +1,24 @@
+import io
+import random
+
+import pdfplumber
+
+from benchmarks.corpus import generate, resume_lines
+
+
+def test_the_same_seed_gives_the_same_corpus():
+    assert [(name, spec) for name, _, spec in generate(6, seed=3)] == [(name, spec) for name, _, spec in generate(6, seed=3)]
+    assert resume_lines(random.Random(1), ["Python"]) == resume_lines(random.Random(1), ["Python"])
+
+
+def test_specs_cycle_through_every_combination():
+    specs = [spec for _, _, spec in generate(27, formats=("pdf",))]
+    assert len({(spec["pages"], spec["skill_density"], spec["years"]) for spec in specs}) == 27
+
+
+def test_resumes_are_built_as_their_spec_says():
+    for name, data, spec in generate(9, formats=("pdf",)):
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
+            assert len(pdf.pages) == spec["pages"], name
+            text = "\n".join(page.extract_text() for page in pdf.pages)
+        assert f"with {spec['years']} years of experience" in text, name
@@ -0,0 +1,33 @@
+import random
+
+from benchmarks.corpus import resume_lines
+from document import ResumeDocument
+from keywords import line_classifier
+
+
+def sample_text(seed):
+    return "\n".join(resume_lines(random.Random(seed), ["Python", "AWS", "Docker", "SQL"], years=6))
+
+
+def test_views_match_the_plain_string_operations():
+    text = sample_text(0)
+    doc = ResumeDocument(text)
+    assert doc.lower == text.lower()
+    assert doc.lower_lines == text.lower().split("\n")
+    assert doc.word_count == len(text.split())
+    assert doc.nonempty_lines == [line.strip() for line in text.split("\n") if line.strip()]
+
+
+def test_one_scan_tags_lines_like_classifying_each_line():
+    doc = ResumeDocument(sample_text(1))
+    assert doc.line_tags == [line_classifier.classify(line)[0] for line in doc.lines]
+    for family in ("action_verb", "impact", "job_title"):
+        assert doc.tagged_lines(family) == [line for line in doc.lines if family in line_classifier.classify(line)[0]]
+
+
+def test_reused_line_tags_equal_a_fresh_classification():
+    full = ResumeDocument(sample_text(2))
+    lines = full.lines[::3] + ["  " + full.lines[1] + "  ", "A line the full text never had"]
+    part = ResumeDocument("\n".join(lines))
+    part.reuse_line_tags(full)
+    assert part.line_tags == ResumeDocument(part.text).line_tags
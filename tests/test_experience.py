@@ -0,0 +1,42 @@
+from datetime import date
+
+from experience import experience_years, find_intervals
+
+TODAY = date(2024, 6, 1)
+
+
+def years(text):
+    return experience_years(text, TODAY)
+
+
+def test_job_titles_with_education_words_still_count():
+    assert years("Scrum Master, Acme  Jan 2019 - Mar 2021") == 2.2
+    assert years("Instructor, Coding Academy  Jan 2020 - Jan 2021") == 1.0
+
+
+def test_education_lines_are_skipped():
+    assert years("B.Tech, XYZ University  2014 - 2018") == 0
+    assert years("Master's in Computer Science  Aug 2018 - May 2020") == 0
+    assert years("Bachelor of Science, GPA 3.8  Sep 2014 - Jun 2018") == 0
+
+
+def test_bare_year_ranges_need_a_role_or_company():
+    assert years("Phone: 2019-2020") == 0
+    assert years("Software Engineer, Acme Corp  2018 - 2020") == 2.0
+    assert years("Data Analyst\n2018 - 2020") == 2.0  # the title on the line before
+    assert years("Mar 2018 - 2020") == 1.8  # a month is enough
+
+
+def test_ranges_are_case_insensitive_and_on_one_line():
+    assert years("MARCH 2020 - JUNE 2021") == 1.2
+    assert years("Developer  Jan 2020 -\nMar 2021") == 0
+
+
+def test_every_line_with_a_year_is_scanned():
+    text = "Summary\nDeveloper  Jan 2018 - Jan 2019\nSkills: Python\nEngineer  Jan 2020 - Present\nAwards 2023"
+    assert find_intervals(text, TODAY) == [(2018 * 12, 2019 * 12), (2020 * 12, 2024 * 12 + 5)]
+
+
+def test_overlapping_and_future_ranges():
+    assert years("Developer  Jan 2018 - Jan 2020\nConsultant  Jan 2019 - Jan 2021") == 3.0
+    assert years("Engineer  Jan 2023 - Jan 2026") == 0
@@ -0,0 +1,87 @@
+import io
+import zipfile
+
+from docx import Document
+
+from benchmarks.pdf_writer import write_pdf
+from extraction import detect_format
+from parser import extract_text
+
+
+def docx_bytes(lines):
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_format_comes_from_the_content_not_the_name(tmp_path):
+    pdf, docx = write_pdf([["Jane Doe"]]), docx_bytes(["Jane Doe"])
+    other_zip = io.BytesIO()
+    with zipfile.ZipFile(other_zip, "w") as archive:
+        archive.writestr("notes.txt", "not a document")
+    assert detect_format(pdf) == "pdf"
+    assert detect_format(b"\r\n" + pdf) == "pdf"  # a little junk before the header
+    assert detect_format(docx) == "docx"
+    assert detect_format(other_zip.getvalue()) is None
+    assert detect_format(b"plain text") is None
+    misnamed = tmp_path / "resume.docx"
+    misnamed.write_bytes(pdf)
+    assert detect_format(str(misnamed)) == "pdf"
+
+
+def test_bytes_file_objects_and_paths_give_the_same_text(tmp_path):
+    for data in (write_pdf([["Jane Doe", "Python developer"]]), docx_bytes(["Jane Doe", "Python developer"])):
+        path = tmp_path / "resume"
+        path.write_bytes(data)
+        stream = io.BytesIO(data)
+        stream.seek(10)  # file objects are rewound before reading
+        texts = [extract_text(data), extract_text(stream), extract_text(str(path))]
+        assert "Python developer" in texts[0] and texts == [texts[0]] * 3
+
+
+def test_parallel_extraction_matches_serial_and_stops_at_the_character_budget(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import extraction
+
+    path = str(tmp_path / "long.pdf")
+    with open(path, "wb") as f:
+        f.write(write_pdf([[f"Page {page} line {line} of the portfolio" for line in range(20)] for page in range(8)]))
+    serial = list(extraction.iter_pdf_pages(path, max_pages=0, max_chars=0, parallel=False))
+
+    read = []
+    extract_page_range = extraction.extract_page_range
+
+    def counting_extract_page_range(source, first, last):
+        read.extend(range(first, last + 1))
+        return extract_page_range(source, first, last)
+
+    monkeypatch.setattr(extraction, "extract_page_range", counting_extract_page_range)
+    monkeypatch.setattr(extraction, "PDF_PAGE_WORKERS", 2)
+    with ThreadPoolExecutor(max_workers=2) as pool:  # threads stand in for the worker processes
+        monkeypatch.setattr(extraction, "page_pool", lambda: pool)
+        assert list(extraction.iter_pdf_pages(path, max_pages=0, max_chars=0, parallel=True)) == serial
+        assert sorted(read) == list(range(1, 9))
+
+        read.clear()
+        budgeted = list(extraction.iter_pdf_pages(path, max_pages=0, max_chars=len(serial[0]) + 1, parallel=True))
+    assert budgeted == serial[:2]
+    assert len(read) < 8  # the ranges past the budget were never submitted
+
+
+def test_pages_are_read_within_the_page_and_character_budgets(tmp_path):
+    import extraction
+
+    pages = [[f"Page {page} line {line}" for line in range(10)] for page in range(5)]
+    pages[1] = []  # a blank page is skipped, not returned empty
+    data = write_pdf(pages)
+    every = list(extraction.iter_pdf_pages(data, max_pages=0, max_chars=0, parallel=False))
+    assert [text.split()[1] for text in every] == ["0", "2", "3", "4"]
+
+    assert list(extraction.iter_pdf_pages(data, max_pages=3, max_chars=0, parallel=False)) == every[:2]
+    # The page that crosses the character budget is kept whole, and nothing after it is read
+    assert list(extraction.iter_pdf_pages(data, max_pages=0, max_chars=len(every[0]) + 1, parallel=False)) == every[:2]
+    assert list(extraction.iter_pdf_pages(data, max_pages=0, max_chars=len(every[0]), parallel=False)) == every[:1]
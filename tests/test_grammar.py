@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from benchmarks.corpus import resume_lines
+
+pytest.importorskip("spellchecker")
+
+from grammar import SpellingChecker
+from scoring import ResumeFeatures, score_optimization
+
+def test_spelling_checker_accepts_clean_resumes():
+    checker = SpellingChecker()
+    for seed in range(5):
+        text = "\n".join(resume_lines(random.Random(seed), ["Python", "AWS", "Docker"], years=4))
+        assert checker(text) == 0
+
+def test_spelling_checker_skips_links_and_knows_resume_words():
+    checker = SpellingChecker()
+    text = "priya.iyer@example.com | github.com/priyaiyer | linkedin.com/in/priyaiyer\nImproved uptime and CI workflows"
+    assert checker(text) == 0
+    assert checker("managng a team and recieved awards") == 2
+
+
+def optimization_score(text, grammar_errors):
+    features = ResumeFeatures({}, text)
+    features.grammar_errors = grammar_errors  # skip the checker, only the thresholds are under test
+    return score_optimization(text, {}, features)
+
+
+def test_grammar_thresholds_are_per_page():
+    text = "word " * 1200  # three pages of 2000 characters
+    clean, _ = optimization_score(text, 0)
+    six, breakdown = optimization_score(text, 6)
+    nine, _ = optimization_score(text, 9)
+    assert breakdown["spelling_grammar_issues"] == 6
+    assert six == clean  # two per page
+    assert nine == clean - 2  # three per page
+
+
+def test_tech_vocabulary_finds_the_bundled_profiles_from_any_directory(tmp_path, monkeypatch):
+    from grammar import tech_vocabulary
+
+    monkeypatch.chdir(tmp_path)
+    tech_vocabulary.cache_clear()
+    try:
+        vocabulary = tech_vocabulary()
+    finally:
+        tech_vocabulary.cache_clear()
+    assert "dashboards" in vocabulary  # a profile keyword, not a known skill
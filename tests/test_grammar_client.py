@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+pytest.importorskip("requests")
+
+from cache import DiskCache
+from grammar import LanguageToolClient, split_chunks
+
+
+class FakeLanguageTool(BaseHTTPRequestHandler):
+    """Answers /v2/check with one match per "teh" in the text, after a short delay so requests overlap."""
+
+    def do_POST(self):
+        server = self.server
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+        with server.lock:
+            server.texts.append(form["text"][0])
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+        body = json.dumps({"matches": [{}] * form["text"][0].count("teh")}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def languagetool():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeLanguageTool)
+    httpd.lock = threading.Lock()
+    httpd.texts, httpd.active, httpd.peak, httpd.delay = [], 0, 0, 0.05
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}/v2/check"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client_for(tmp_path):
+    clients = []
+
+    def make(url, **options):
+        client = LanguageToolClient(url, cache=DiskCache(str(tmp_path / "grammar")), **options)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def document(lines):
+    return "".join(f"Line {i} has teh typo\n" for i in range(lines))
+
+
+def test_counts_matches_over_every_chunk(languagetool, client_for):
+    httpd, url = languagetool
+    client = client_for(url, chunk_chars=100)
+    assert client(document(20)) == 20
+    assert len(httpd.texts) > 1
+    assert all(len(text) <= 100 for text in httpd.texts)
+    assert sorted(httpd.texts) == sorted(split_chunks(document(20), 100))
+
+
+def test_keeps_at_most_max_concurrency_requests_in_flight(languagetool, client_for):
+    httpd, url = languagetool
+    client = client_for(url, chunk_chars=30, max_concurrency=3)
+    assert client(document(24)) == 24
+    assert len(httpd.texts) == 24
+    assert 1 < httpd.peak <= 3
+
+
+def test_repeat_checks_are_served_from_the_cache(languagetool, client_for):
+    httpd, url = languagetool
+    client = client_for(url, chunk_chars=100)
+    first = client(document(20))
+    sent = len(httpd.texts)
+    assert client(document(20)) == first
+    assert len(httpd.texts) == sent
+    # A new client over the same cache directory doesn't ask again either
+    assert client_for(url, chunk_chars=100)(document(20)) == first
+    assert len(httpd.texts) == sent
+
+
+def test_returns_none_when_the_server_is_unreachable(languagetool, client_for, capsys):
+    httpd, url = languagetool
+    httpd.shutdown()
+    httpd.server_close()
+    client = client_for(url, timeout=1)
+    assert client(document(3)) is None
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Grammar API failed" in captured.err
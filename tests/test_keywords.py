@@ -0,0 +1,24 @@
+from keywords import line_classifier
+
+
+def families(line):
+    return line_classifier.classify(line)[0]
+
+
+def test_keywords_match_plurals_and_inflections():
+    assert "certification" in families("Certifications")
+    assert "job_title" in families("Senior Engineers")
+    assert "job_title" in families("Developers, Analysts and Consultants")
+    assert "job_title" in families("Software Engineering intern")
+    assert "certification" in families("Completed two courses")
+
+
+def test_keywords_do_not_match_inside_other_words():
+    assert families("Skilled in Python") == set()
+    assert "certification" not in families("Won a hackathon")
+
+
+def test_lines_are_classified_separately():
+    assert line_classifier.classify("Led a team of five\nPython, SQL\nLinkedIn") == [
+        {"action_verb", "achievement", "experience"}, set(), {"online_presence"},
+    ]
@@ -0,0 +1,34 @@
+from matcher import KeywordMatcher
+
+
+def test_terms_match_whole_words_case_insensitively():
+    matcher = KeywordMatcher(["Java", "Go", "C++", "Node.js"])
+    assert matcher.findall("JavaScript and golang; good at C++ and NODE.JS") == {"c++", "node.js"}
+    assert matcher.findall("java, Go") == {"java", "go"}
+
+
+def test_suffixes_are_optional_and_outside_the_reported_term():
+    matcher = KeywordMatcher(["API", "engineer"], ("s", "ing"))
+    assert list(matcher.finditer("APIs engineering")) == [(0, 3, "API"), (5, 13, "engineer")]
+    assert matcher.findall("engineered apisx") == set()
+    assert KeywordMatcher(["API"]).findall("APIs") == set()
+
+
+def test_overlapping_and_nested_terms_are_all_reported():
+    matcher = KeywordMatcher(["Machine Learning", "Learning", "API", "API Design"])
+    assert list(matcher.finditer("machine learning, api design")) == [
+        (0, 16, "Machine Learning"), (8, 16, "Learning"), (18, 21, "API"), (18, 28, "API Design"),
+    ]
+
+
+def test_offsets_hold_when_lowercasing_changes_the_length():
+    matcher = KeywordMatcher(["Python"])
+    text = "İstanbul Python"  # "İ".lower() is two characters
+    [(start, end, term)] = matcher.finditer(text)
+    assert text[start:end] == "Python" and term == "Python"
+
+
+def test_empty_matcher_finds_nothing():
+    matcher = KeywordMatcher([])
+    assert matcher.findall("anything") == set() and list(matcher.finditer("anything")) == []
+    assert len(matcher) == 0 and "x" not in matcher
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from benchmarks.corpus import resume_lines
+from parser import load_nlp, entities_from_doc, guess_name, header_window, known_skills
+
+
+def test_ner_mode_finds_the_same_entities_as_the_full_pipeline():
+    full, ner = load_nlp("full"), load_nlp("ner")
+    assert ner.pipe_names == ["ner"] or set(ner.pipe_names) < set(full.pipe_names)
+    rng = random.Random(0)
+    texts = ["\n".join(resume_lines(rng, known_skills, years=years)) for years in (1, 4, 10)]
+    # Headers guess_name gives up on, so NER decides the name
+    texts += ["Resume of Maria Garcia\nmaria@example.com\nSkills\nPython, SQL",
+              "Curriculum Vitae\nPrepared for Acme by Wei Chen, Data Analyst\nWork Experience\nAnalyst 2019 - 2021"]
+    for text in texts:
+        for window in (header_window(text), text):
+            full_doc, ner_doc = full(window), ner(window)
+            assert [(ent.text, ent.label_) for ent in full_doc.ents] == [(ent.text, ent.label_) for ent in ner_doc.ents]
+            assert entities_from_doc(text, full_doc) == entities_from_doc(text, ner_doc)
+
+
+def test_guess_name_does_not_depend_on_the_pipeline():
+    assert guess_name("JANE DOE | jane@example.com\nSummary") == "Jane Doe"
+    assert guess_name("Curriculum Vitae\nSoftware Engineer") is None
+
+
+def test_fast_mode_swaps_the_parser_for_the_sentencizer():
+    fast = load_nlp("fast")
+    assert fast.pipe_names[0] == "sentencizer" and "ner" in fast.pipe_names and "parser" not in fast.pipe_names
+    assert list(fast("Jane Doe. Python developer.").sents)
+
+
+def test_unknown_modes_are_rejected():
+    with pytest.raises(ValueError, match="Unknown NLP mode"):
+        load_nlp("tiny")
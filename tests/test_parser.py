@@ -0,0 +1,55 @@
+import pytest
+
+from benchmarks.pdf_writer import write_pdf
+from parser import extract_text
+from extraction import ExtractionError
+
+
+def test_extract_text_reads_a_pdf():
+    assert "Jane Doe" in extract_text(write_pdf([["Jane Doe", "Python developer"]]))
+
+
+def test_extract_text_raises_on_unsupported_files():
+    with pytest.raises(ExtractionError, match="Unsupported file format"):
+        extract_text(b"just some plain text", name="notes.txt")
+
+
+def test_extract_text_raises_on_corrupt_pdfs():
+    with pytest.raises(ExtractionError, match="broken.pdf"):
+        extract_text(b"%PDF-1.4\n" + b"\x00garbage" * 100, name="broken.pdf")
+
+
+def test_batched_entities_match_one_at_a_time():
+    import random
+
+    from benchmarks.corpus import resume_lines
+    from parser import extract_entities, extract_entities_batch, known_skills
+
+    rng = random.Random(1)
+    texts = ["\n".join(resume_lines(rng, known_skills, years=years)) for years in (1, 4, 10)]
+    texts.append("Curriculum Vitae\nPrepared for Acme by Wei Chen, Data Analyst\nSkills\nPython, SQL")  # falls back to NER
+    for full_ner in (False, True):
+        assert extract_entities_batch(texts, batch_size=2, full_ner=full_ner) == [
+            extract_entities(text, full_ner=full_ner) for text in texts
+        ]
+
+
+def test_guess_name_reads_the_first_header_line():
+    from parser import guess_name
+
+    assert guess_name("JANE DOE | jane@example.com\nSummary") == "Jane Doe"
+    assert guess_name("\nCurriculum Vitae\nWei Chen\nData Analyst") == "Wei Chen"
+
+
+@pytest.mark.parametrize("header", [
+    "About Me\nI build reliable services",
+    "Personal Statement\nMotivated engineer",
+    "Google Inc\nJane Doe",
+    "New York City | jane@example.com",
+    "Resume of Maria Garcia",
+    "Contact\nJane Doe",  # a heading first: the name further down is left to NER
+])
+def test_guess_name_leaves_headings_organisations_and_places_to_ner(header):
+    from parser import guess_name
+
+    assert guess_name(header) is None
@@ -0,0 +1,35 @@
+from ranking import TopN
+
+
+def names(ranking):
+    return [name for name, _, _ in ranking.items()]
+
+
+def test_keeps_the_best_n_best_first():
+    ranking = TopN(3)
+    for order, score in enumerate([40, 90, 10, 70, 85]):
+        ranking.push(f"r{order}", score, {}, order=order)
+    assert names(ranking) == ["r1", "r4", "r3"]
+    assert ranking.seen == 5 and len(ranking) == 3
+
+
+def test_ties_go_to_the_earlier_upload_whatever_the_arrival_order():
+    ranking = TopN(2)
+    # Results stream in completion order, not upload order
+    for order in (3, 0, 2, 1):
+        ranking.push(f"r{order}", 80, {}, order=order)
+    assert names(ranking) == ["r0", "r1"]
+
+
+def test_min_score_filters_on_push():
+    ranking = TopN(5, min_score=50)
+    assert ranking.push("low", 49, {}) is False
+    assert ranking.push("high", 50, {}) is True
+    assert names(ranking) == ["high"] and ranking.qualified == 1
+
+
+def test_push_reports_whether_the_leaderboard_changed():
+    ranking = TopN(1)
+    assert ranking.push("a", 60, {}, order=0) is True
+    assert ranking.push("b", 60, {}, order=1) is False  # a tie loses to the earlier upload
+    assert ranking.push("c", 61, {}, order=2) is True
@@ -0,0 +1,65 @@
+import scoring
+from scoring import ResumeFeatures, score_resume
+
+PROFILE = {"required_skills": ["Python"], "preferred_skills": ["Docker"], "keywords": ["backend"], "job_specific_keywords": []}
+TEXT = "Jane Doe\njane@example.com\nSkills: Python, Docker\nBuilt backend services, cutting latency 30%"
+PARSED = {"name": ["Jane Doe"], "skills": ["Python", "Docker"]}
+
+
+def test_timings_include_the_grammar_check_of_precomputed_features(monkeypatch):
+    monkeypatch.setattr(scoring, "grammar_check", lambda text: 0)
+    features = ResumeFeatures(PARSED, TEXT)
+    for _ in range(2):  # the second score reuses the grammar result and still reports its cost
+        timings = score_resume(PARSED, PROFILE, TEXT, features=features)["timings"]
+        assert timings["grammar_check"]["calls"] == 1
+        assert "score_optimization" in timings
+
+
+def test_features_built_by_score_resume_record_each_stage_once(monkeypatch):
+    monkeypatch.setattr(scoring, "grammar_check", lambda text: 0)
+    timings = score_resume(PARSED, PROFILE, TEXT)["timings"]
+    assert timings["grammar_check"]["calls"] == 1
+    assert timings["score_content"]["calls"] == 1
+
+
+def test_scores_from_a_summary_match_scores_from_the_text(monkeypatch):
+    import os
+    import random
+    import pickle
+
+    from benchmarks.corpus import resume_lines
+    from utils import load_job_profiles
+
+    monkeypatch.setattr(scoring, "grammar_check", lambda text: len(text) % 7)
+    job_profiles = load_job_profiles(os.path.join(os.path.dirname(scoring.__file__), "job_profile.json"))
+    profiles = [profile for roles in job_profiles.values() for profile in roles.values()]
+    matcher = profiles[0].matcher
+    for seed in range(3):
+        rng = random.Random(seed)
+        skills = rng.sample(sorted({skill for profile in profiles for skill in profile.get("required_skills", [])}), 6)
+        text = "\n".join(resume_lines(rng, skills, years=seed * 3))
+        parsed = {"name": ["Jane Doe"], "skills": skills, "email": ["jane@example.com"]}
+        features = ResumeFeatures(parsed, text, "docx")
+        score_resume(parsed, profiles[0], text, "docx", features=features)
+        summary = pickle.loads(pickle.dumps(features.summary(matcher)))  # as it comes back from a worker
+        restored = ResumeFeatures.from_summary(parsed, summary, matcher, "docx")
+        for profile in profiles:
+            expected = score_resume(parsed, profile, text, "docx", features=features)
+            actual = score_resume(parsed, profile, "", "docx", features=restored)
+            expected.pop("timings"), actual.pop("timings")
+            assert actual == expected
+
+
+def test_rank_roles_scores_every_role_best_first(monkeypatch):
+    import os
+
+    from utils import load_job_profiles
+
+    monkeypatch.setattr(scoring, "grammar_check", lambda text: 1)
+    job_profiles = load_job_profiles(os.path.join(os.path.dirname(scoring.__file__), "job_profile.json"))
+    ranked = scoring.rank_roles(PARSED, TEXT, job_profiles)
+    assert len(ranked) == sum(len(roles) for roles in job_profiles.values())
+    assert [entry["total_score"] for entry in ranked] == sorted((entry["total_score"] for entry in ranked), reverse=True)
+    for entry in ranked:
+        alone = score_resume(PARSED, job_profiles[entry["category"]][entry["role"]], TEXT)
+        assert (entry["total_score"], entry["breakdown"]) == (alone["total_score"], alone["breakdown"])
@@ -0,0 +1,127 @@
+import json
+import socket
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+import service
+
+
+class FakeService:
+    """
+    Stands in for ScoringService without worker processes: reserve fails while
+    saturated is set, and submit returns whatever next_future holds.
+    """
+
+    workers = 1
+    capacity = 1
+    in_flight = 0
+
+    def __init__(self, timeout=0.2):
+        self.job_profiles = {"Experienced": {"Developer": {}}}
+        self.timeout = timeout
+        self.next_future = None
+        self.saturated = False
+        self.reserved = 0
+
+    def reserve(self):
+        if self.saturated:
+            return False
+        self.reserved += 1
+        return True
+
+    def release(self, _=None):
+        self.reserved -= 1
+
+    def submit(self, file_name, data, category, role):
+        return self.next_future
+
+
+@pytest.fixture
+def server():
+    fake = FakeService()
+    httpd = service.make_server(fake, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield fake, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(port, headers, body=b"", path="/score?category=Experienced&role=Developer&filename=cv.pdf"):
+    """Sends a raw request, so headers such as a bogus Content-Length go out as written."""
+    request = f"POST {path} HTTP/1.1\r\nHost: localhost\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+        connection.sendall(request.encode("latin-1") + b"\r\n" + body)
+        response = b""
+        while chunk := connection.recv(65536):
+            response += chunk
+            head, _, payload = response.partition(b"\r\n\r\n")
+            length = next((int(line.split(b":")[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")), None)
+            if length is not None and len(payload) >= length:
+                break
+    status = int(head.split(b" ")[1])
+    return status, json.loads(payload)
+
+
+def test_scores_an_upload(server):
+    fake, port = server
+    fake.next_future = Future()
+    fake.next_future.set_result({"total_score": 70})
+    assert post(port, {"Content-Length": 3}, b"pdf") == (
+        200, {"file": "cv.pdf", "category": "Experienced", "role": "Developer", "total_score": 70})
+
+
+def test_rejects_uploads_over_the_size_limit(server, monkeypatch):
+    _, port = server
+    monkeypatch.setattr(service, "MAX_UPLOAD_BYTES", 10)
+    assert post(port, {"Content-Length": 11})[0] == 413
+
+
+@pytest.mark.parametrize("length", ["-1", "abc"])
+def test_rejects_bad_content_length(server, length):
+    _, port = server
+    status, payload = post(port, {"Content-Length": length}, b"pdf")
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+
+def test_turns_uploads_away_when_saturated_without_reading_them(server):
+    fake, port = server
+    fake.saturated = True
+    # No body is sent: the server must answer from the headers alone
+    status, payload = post(port, {"Content-Length": 3})
+    assert status == 429
+    assert "retry" in payload["error"]
+
+
+def test_gives_the_slot_back_when_the_upload_is_rejected(server):
+    fake, port = server
+    assert post(port, {"Content-Length": 3}, b"pdf", path="/score?category=Experienced&role=Tester")[0] == 400
+    assert fake.reserved == 0
+
+
+def test_times_out_slow_scoring(server):
+    fake, port = server
+    fake.next_future = Future()  # never completes
+    assert post(port, {"Content-Length": 3}, b"pdf")[0] == 504
+
+
+def test_reports_unreadable_resumes(server):
+    fake, port = server
+    fake.next_future = Future()
+    fake.next_future.set_exception(service.ExtractionError("No text could be extracted from cv.pdf"))
+    assert post(port, {"Content-Length": 3}, b"pdf") == (422, {"error": "No text could be extracted from cv.pdf"})
+
+
+def test_reserve_hands_out_at_most_capacity_slots():
+    scoring = service.ScoringService(service.__file__.replace("service.py", "job_profile.json"), workers=1, queue=1)
+    try:
+        assert scoring.reserve() and scoring.reserve()
+        assert not scoring.reserve()
+        assert scoring.in_flight == 2
+        scoring.release()
+        assert scoring.reserve()
+    finally:
+        scoring.close()
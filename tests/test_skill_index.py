@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from skill_index import SkillIndex, parse_query, tokenize
+
+CANDIDATES = {
+    "ana": ["Python", "AWS", "Docker"],
+    "ben": ["Python", "Azure"],
+    "cai": ["Java", "AWS"],
+    "dev": ["Machine Learning", "Python", "GCP"],
+    "eli": [],
+}
+
+
+@pytest.fixture
+def index():
+    return SkillIndex.from_skill_lists(CANDIDATES.items())
+
+
+def test_and_binds_tighter_than_or(index):
+    assert parse_query("java OR python AND azure") == ("or", ("skill", "java"), ("and", ("skill", "python"), ("skill", "azure")))
+    assert set(index.search("java OR python AND azure")) == {"cai", "ben"}
+    assert set(index.search("(java OR python) AND aws")) == {"ana", "cai"}
+
+
+def test_not_applies_to_the_next_factor_within_the_indexed_candidates(index):
+    assert set(index.search("NOT python")) == {"cai", "eli"}
+    assert set(index.search("python AND NOT (aws OR azure)")) == {"dev"}
+    assert set(index.search("NOT NOT java")) == {"cai"}
+
+
+def test_bare_words_form_one_skill_and_quotes_escape_operators():
+    assert tokenize("machine learning and AWS") == [("skill", "machine learning"), ("and", "and"), ("skill", "aws")]
+    assert tokenize('"or" OR c++') == [("skill", "or"), ("or", "or"), ("skill", "c++")]
+
+
+def test_unknown_skills_match_nobody(index):
+    assert index.search("cobol") == []
+    assert index.count("python AND cobol") == 0
+    assert set(index.search("NOT cobol")) == set(CANDIDATES)
+
+
+@pytest.mark.parametrize("query", ["", "   ", "python AND", "OR aws", "(python", "python)", "NOT", "python AND AND aws", "()"])
+def test_malformed_queries_raise_value_error(index, query):
+    with pytest.raises(ValueError):
+        index.search(query)
+
+
+def test_updates_and_removals_keep_queries_exact(index):
+    index.add("ben", ["Python", "AWS"])
+    index.remove("cai")
+    index.add("fay", ["Java"])  # reuses cai's slot
+    assert set(index.search("aws")) == {"ana", "ben"}
+    assert set(index.search("java")) == {"fay"}
+    assert set(index.search("NOT python")) == {"eli", "fay"}
+    assert "cai" not in index and len(index) == 5
+
+
+def random_query(rng, skills, depth=0):
+    choice = rng.random()
+    if depth > 3 or choice < 0.35:
+        return rng.choice(skills)
+    if choice < 0.5:
+        return f"NOT {random_query(rng, skills, depth + 1)}"
+    operator = rng.choice(["AND", "OR"])
+    return f"({random_query(rng, skills, depth + 1)} {operator} {random_query(rng, skills, depth + 1)})"
+
+
+def linear_match(node, skills):
+    kind = node[0]
+    if kind == "skill":
+        return node[1] in skills
+    if kind == "not":
+        return not linear_match(node[1], skills)
+    if kind == "and":
+        return linear_match(node[1], skills) and linear_match(node[2], skills)
+    return linear_match(node[1], skills) or linear_match(node[2], skills)
+
+
+def test_matches_a_linear_scan_on_random_queries():
+    rng = random.Random(7)
+    vocabulary = ["python", "aws", "docker", "java", "gcp", "sql", "react", "go", "rust", "kotlin"]
+    candidates = {f"c{i}": set(rng.sample(vocabulary, rng.randint(0, 5))) for i in range(300)}
+    index = SkillIndex.from_skill_lists(candidates.items())
+    for i in range(0, 300, 7):  # churn, so reused slots are covered too
+        index.remove(f"c{i}")
+        del candidates[f"c{i}"]
+    for i in range(300, 330):
+        candidates[f"c{i}"] = set(rng.sample(vocabulary, rng.randint(0, 5)))
+        index.add(f"c{i}", candidates[f"c{i}"])
+
+    for _ in range(300):
+        query = random_query(rng, vocabulary + ["cobol"])
+        node = parse_query(query)
+        expected = {candidate for candidate, skills in candidates.items() if linear_match(node, skills)}
+        assert set(index.search(query)) == expected, query
+        ids, exclude_ids = index.matches(query)
+        assert (set(ids) if ids is not None else set(candidates) - set(exclude_ids)) == expected, query
@@ -0,0 +1,49 @@
+import sqlite3
+from datetime import date
+
+from store import CandidateStore
+
+ONGOING = "Jane Doe\nSoftware Engineer, Acme Corp  Jan 2020 - Present\nAnalyst, Initech  Jan 2018 - Jan 2019"
+CLOSED = "John Roe\nDeveloper, Globex  Jan 2015 - Jan 2020"
+
+
+def candidate(file_hash, text, skills=("python",)):
+    return file_hash, f"{file_hash}.pdf", text, {"name": [file_hash], "skills": list(skills)}
+
+
+def test_experience_of_ongoing_roles_stays_current(tmp_path):
+    store = CandidateStore(str(tmp_path / "candidates.db"))
+    store.add_candidates([candidate("a", ONGOING), candidate("b", CLOSED)])
+    years = {row["file_hash"]: row["experience_years"] for row in store.search()}
+
+    assert store.refresh_experience(date.today()) == 0  # already current this month
+    assert store.refresh_experience(date(date.today().year + 2, date.today().month, 1)) == 1
+    later = {row["file_hash"]: row["experience_years"] for row in store.search(limit=None)}
+    assert later == {"a": years["a"] + 2, "b": 5.0}
+
+
+def test_stores_from_before_the_experience_columns_are_migrated(tmp_path):
+    path = str(tmp_path / "candidates.db")
+    store = CandidateStore(path)
+    store.add_candidates([candidate("a", ONGOING)])
+    expected = store.search()[0]["experience_years"]
+    store.close()
+    connection = sqlite3.connect(path)
+    connection.execute("DROP INDEX candidates_ongoing")
+    for column in ("experience_months", "experience_since", "experience_as_of"):
+        connection.execute(f"ALTER TABLE candidates DROP COLUMN {column}")
+    connection.execute("UPDATE candidates SET experience_years = 1")
+    connection.commit()
+    connection.close()
+
+    assert CandidateStore(path).search()[0]["experience_years"] == expected
+
+
+def test_unscored_candidates_without_a_limit(tmp_path):
+    store = CandidateStore(str(tmp_path / "candidates.db"))
+    store.add_candidates([candidate(f"{index:02}", CLOSED) for index in range(60)])
+    store.add_scores([("00", "Experienced", "Developer", {"total_score": 70})])
+
+    assert len(store.search()) == 50
+    unscored = store.search(unscored_for=("Experienced", "Developer"), limit=None)
+    assert len(unscored) == 59 and "00" not in {row["file_hash"] for row in unscored}
@@ -0,0 +1,18 @@
+from utils import compile_job_profile
+
+
+def profile_matches(text, field="required_skills", **terms):
+    profile = compile_job_profile({field: terms.get(field, [])})
+    return profile.match(field, profile.matcher.findall(text))
+
+
+def test_profile_terms_match_whole_words_only():
+    skills = ["Java", "Go", "SQL", "AI"]
+    text = "JavaScript developer, good at PostgreSQL, maintained email tooling"
+    assert profile_matches(text, required_skills=skills) == []
+
+
+def test_profile_terms_match_case_insensitively_and_in_plural():
+    skills = ["Java", "API", "Microservice", "Go"]
+    text = "Built java services and REST APIs; split the monolith into microservices. Go, Rust"
+    assert profile_matches(text, required_skills=skills) == ["Java", "API", "Microservice", "Go"]
@@ -0,0 +1,86 @@
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# tracemalloc slows Python allocations down noticeably, so memory peaks are only
+# recorded when asked for
+TRACE_MEMORY = os.environ.get("RESUME_PARSER_TRACE_MEMORY", "0") == "1"
+
+
+class StageTimer:
+    """
+    Records wall time, CPU time and, with trace_memory, the tracemalloc peak of
+    named pipeline stages. A stage entered more than once accumulates. Stages
+    may nest (grammar_check runs inside score_optimization); each is timed on
+    its own and the outer one includes the inner.
+    """
+
+    def __init__(self, trace_memory=TRACE_MEMORY):
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self._peaks = []  # highest traced memory seen so far by each open stage
+
+    @contextmanager
+    def stage(self, name):
+        baseline = self._start_tracing() if self.trace_memory else None
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - wall) * 1000, (time.thread_time() - cpu) * 1000)
+            if baseline is not None:
+                entry = self.stages[name]
+                entry["peak_kb"] = max(entry.get("peak_kb", 0.0), self._stop_tracing(baseline) / 1024)
+
+    def add(self, name, wall_ms, cpu_ms):
+        """Record a stage timed elsewhere, e.g. this resume's share of a batched step."""
+        entry = self.stages.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+        entry["calls"] += 1
+        entry["wall_ms"] += wall_ms
+        entry["cpu_ms"] += cpu_ms
+
+    def include(self, other):
+        """Copy in the stages another timer recorded that this one has not, e.g. features computed earlier."""
+        for name, entry in other.stages.items():
+            if name not in self.stages:
+                self.stages[name] = dict(entry)
+
+    def _start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)  # keep the outer stage's peak before resetting
+        tracemalloc.reset_peak()
+        self._peaks.append(current)
+        return current
+
+    def _stop_tracing(self, baseline):
+        peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        tracemalloc.reset_peak()
+        return peak - baseline  # growth over what was allocated when the stage began
+
+    def as_dict(self):
+        """Stage -> {"calls", "wall_ms", "cpu_ms"[, "peak_kb"]}, rounded for display."""
+        return {name: {key: round(value, 3) if isinstance(value, float) else value for key, value in entry.items()}
+                for name, entry in self.stages.items()}
+
+
+# Function to add up the timings blocks of many results, for a per-batch summary
+def summarise_timings(timings_list):
+    """Returns stage -> {"resumes", "wall_ms", "cpu_ms", "mean_wall_ms"[, "max_peak_kb"]}, slowest stage first."""
+    totals = {}
+    for timings in timings_list:
+        for name, entry in timings.items():
+            total = totals.setdefault(name, {"resumes": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+            total["resumes"] += 1
+            total["wall_ms"] += entry["wall_ms"]
+            total["cpu_ms"] += entry["cpu_ms"]
+            if "peak_kb" in entry:
+                total["max_peak_kb"] = max(total.get("max_peak_kb", 0.0), entry["peak_kb"])
+    for total in totals.values():
+        total["mean_wall_ms"] = total["wall_ms"] / total["resumes"]
+    return dict(sorted(totals.items(), key=lambda item: item[1]["wall_ms"], reverse=True))
@@ -1,9 +1,59 @@
 import json
 import os
 
+from matcher import KeywordMatcher
+
+# Fields of a job profile that hold terms to look for in a resume
+TERM_FIELDS = ("required_skills", "preferred_skills", "keywords", "job_specific_keywords")
+# Profile terms match whole words, so "Java" is not found in "JavaScript" nor
+# "Go" in "good"; a plural "s" is allowed, so "API" still counts in "APIs"
+TERM_SUFFIXES = ("s",)
+
+
+class JobProfile(dict):
+    """
+    A job profile dict with its term lists lowercased up front and a matcher
+    that finds all of them in one scan. Profiles loaded together share one
+    matcher, so a text scanned once can be checked against any of them.
+    """
+
+    def __init__(self, profile, matcher=None):
+        super().__init__(profile)
+        self.terms = {field: [term.lower() for term in self.get(field, [])] for field in TERM_FIELDS}
+        if matcher is None:
+            matcher = KeywordMatcher((term for field in TERM_FIELDS for term in self.get(field, [])), TERM_SUFFIXES)
+        self.matcher = matcher
+
+    def match(self, field, found):
+        """Terms of field (as written in the profile) present in found, a set from matcher.findall."""
+        return [term for term, key in zip(self.get(field, []), self.terms[field]) if key in found]
+
+
+# Function to compile a plain profile dict; compiled profiles are returned unchanged
+def compile_job_profile(profile, matcher=None):
+    if isinstance(profile, JobProfile):
+        return profile
+    return JobProfile(profile, matcher)
+
+
 def load_job_profiles(filepath="job_profile.json"):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Job profile file '{filepath}' not found. Please create it.")
     with open(filepath, "r") as f:
-        return json.load(f)
+        profiles = json.load(f)
 
+    # One matcher over every term of every role, built once at load time
+    matcher = KeywordMatcher(
+        (
+            term
+            for roles in profiles.values()
+            for profile in roles.values()
+            for field in TERM_FIELDS
+            for term in profile.get(field, [])
+        ),
+        TERM_SUFFIXES,
+    )
+    return {
+        category: {role: JobProfile(profile, matcher) for role, profile in roles.items()}
+        for category, roles in profiles.items()
+    }